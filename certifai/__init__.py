@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from .provenance import annotate_paths, enforce_policy
-from .report import CoverageSummary, build_summary
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .provenance import annotate_paths, enforce_policy
+    from .report import CoverageSummary, build_summary
 
 __all__ = [
     "__version__",
@@ -14,3 +18,21 @@ __all__ = [
 ]
 
 __version__ = "0.1.5"
+
+# Resolved on first access so that importing the package (e.g. for the CLI's
+# --version) does not load the parser, YAML and GitPython.
+_LAZY_ATTRIBUTES = {
+    "annotate_paths": ".provenance",
+    "enforce_policy": ".provenance",
+    "CoverageSummary": ".report",
+    "build_summary": ".report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
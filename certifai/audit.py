@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import gzip
+import io
+import os
+import re
+import shutil
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, TypedDict, Literal, cast
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TypedDict, Literal, cast
 
+from .audit_index import index_path, iter_lines as iter_indexed_lines, iter_records as iter_indexed_records, timestamp_epoch
 from .models import CodeArtifact
 from .policy import AuditSettings, load_policy
 from .utils.logging import get_logger
+from .utils.serialization import JSONDecodeError, dumps_bytes, dumps_line, loads
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
 
 LOGGER = get_logger("audit")
 
 DEFAULT_LOG_PATH = Path(".certifai/audit.log")
-_SEVERITY_ORDER: Dict[str, int] = {
-    "info": 0,
-    "low": 1,
-    "medium": 2,
-    "high": 3,
-    "critical": 4,
-}
+_TAIL_BLOCK_SIZE = 64 * 1024
+_READ_BUFFER_SIZE = 64 * 1024
+_SEGMENT_PATTERN = re.compile(r"\.(\d{6})(\.zst|\.gz)?$")
+# Indexed by severity code: the code of a severity is its position here.
+_SEVERITY_NAMES = ("info", "low", "medium", "high", "critical")
+_SEVERITY_ORDER: Dict[str, int] = {name: code for code, name in enumerate(_SEVERITY_NAMES)}
 
 
 class Finding(TypedDict, total=False):
@@ -42,11 +58,22 @@ class FindingsSummary(TypedDict, total=False):
     info: int
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AuditRecord:
     timestamp: str
     action: str
     data: dict[str, object]
+    ts: int | None = None
+    """Epoch seconds for ``timestamp``; derived from it when not supplied."""
+
+    def to_json_bytes(self) -> bytes:
+        """Return the record as a single JSON line without the trailing newline."""
+
+        ts = self.ts
+        if ts is None:
+            epoch = timestamp_epoch(self.timestamp)
+            ts = int(epoch) if epoch is not None else None
+        return _encode_payload(self.timestamp, ts, self.action, self.data, dumps=dumps_bytes)
 
 
 def _log_path(settings: AuditSettings, override: Path | None = None) -> Path:
@@ -57,48 +84,338 @@ def _log_path(settings: AuditSettings, override: Path | None = None) -> Path:
     return DEFAULT_LOG_PATH
 
 
-def _write_records(settings: AuditSettings, records: Iterable[AuditRecord], override: Path | None = None) -> None:
-    if not settings.enabled:
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+class _LogWriter:
+    """Group-commit appender for a single audit log file.
+
+    Callers enqueue encoded lines; whichever caller holds the write lock drains
+    everything queued so far and appends it with a single ``write`` (and at most
+    one ``fsync``), so concurrent recorders share syscalls instead of each
+    opening and flushing the file. The descriptor stays open between batches.
+    """
+
+    __slots__ = ("path", "_fd", "_pending", "_queue_lock", "_write_lock")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd: int | None = None
+        self._pending: deque[bytes] = deque()
+        self._queue_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def submit(self, lines: Iterable[bytes], *, fsync: bool = False, rotate_bytes: int = 0) -> None:
+        with self._queue_lock:
+            self._pending.extend(lines)
+        with self._write_lock:
+            with self._queue_lock:
+                if not self._pending:
+                    # Another caller already committed our lines in its batch.
+                    return
+                batch = b"".join(self._pending)
+                self._pending.clear()
+            fd = self._append(batch, fsync=fsync, follow_renames=rotate_bytes > 0)
+            if rotate_bytes and os.fstat(fd).st_size >= rotate_bytes:
+                self._rotate()
+
+    def close(self) -> None:
+        with self._write_lock:
+            self._close_fd()
+
+    def _append(self, payload: bytes, *, fsync: bool, follow_renames: bool = False) -> int:
+        fd = self._descriptor(follow_renames=follow_renames)
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if fsync:
+            os.fsync(fd)
+        return fd
+
+    def _descriptor(self, *, follow_renames: bool = False) -> int:
+        fd = self._fd
+        if fd is not None:
+            stat = os.fstat(fd)
+            if stat.st_nlink and not (follow_renames and _renamed_away(self.path, stat)):
+                return fd
+            # The log was unlinked (or rotated by another process) underneath
+            # us; reopen so records are not lost.
+            self._close_fd()
+        try:
+            fd = os.open(self.path, _OPEN_FLAGS, 0o644)
+        except FileNotFoundError:
+            # Only the first append into a fresh directory pays for mkdir.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, _OPEN_FLAGS, 0o644)
+        self._fd = fd
+        return fd
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _rotate(self) -> None:
+        self._close_fd()
+        segment = _next_segment(self.path)
+        try:
+            os.rename(self.path, segment)
+        except FileNotFoundError:
+            # Another process rotated the log first.
+            return
+        index_path(self.path).unlink(missing_ok=True)
+        # Compressing a full segment takes far longer than an append, so do it
+        # off the write path; readers handle the plain segment meanwhile.
+        thread = threading.Thread(target=_compress_segment, args=(segment,), name="certifai-audit-compress")
+        with _COMPRESSIONS_LOCK:
+            _COMPRESSIONS.add(thread)
+        thread.start()
+
+
+_COMPRESSIONS: set[threading.Thread] = set()
+_COMPRESSIONS_LOCK = threading.Lock()
+
+
+def _wait_for_compressions() -> None:
+    """Block until every background segment compression has finished."""
+
+    with _COMPRESSIONS_LOCK:
+        pending = list(_COMPRESSIONS)
+    for thread in pending:
+        thread.join()
+
+
+def _renamed_away(path: Path, stat: os.stat_result) -> bool:
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return True
+    return (current.st_dev, current.st_ino) != (stat.st_dev, stat.st_ino)
+
+
+def _segments(path: Path) -> list[Path]:
+    """Return rotated segments of the log at ``path``, oldest first."""
+
+    prefix = path.name
+    numbered: dict[int, Path] = {}
+    try:
+        entries = os.scandir(path.parent)
+    except FileNotFoundError:
+        return []
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            match = _SEGMENT_PATTERN.fullmatch(entry.name, len(prefix))
+            if match is None:
+                continue
+            number = int(match.group(1))
+            # While a segment is being compressed both forms can exist; the
+            # plain one is authoritative until compression drops it.
+            if number not in numbered or match.group(2) is None:
+                numbered[number] = path.with_name(entry.name)
+    return [numbered[number] for number in sorted(numbered)]
+
+
+def _next_segment(path: Path) -> Path:
+    segments = _segments(path)
+    number = int(_SEGMENT_PATTERN.search(segments[-1].name).group(1)) + 1 if segments else 1
+    return path.with_name(f"{path.name}.{number:06d}")
+
+
+def _compress_segment(segment: Path) -> None:
+    """Compress a rotated segment with zstd (or gzip) and drop the original.
+
+    The plain segment is kept if compression fails, or if a writer still
+    holding the pre-rotation descriptor appended to it in the meantime.
+    """
+
+    try:
+        if zstandard is not None:
+            target = segment.with_name(segment.name + ".zst")
+        else:
+            target = segment.with_name(segment.name + ".gz")
+        partial = target.with_name(target.name + ".tmp")
+        try:
+            with segment.open("rb") as source, partial.open("wb") as raw:
+                if zstandard is not None:
+                    zstandard.ZstdCompressor(level=3).copy_stream(source, raw)
+                else:
+                    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as destination:
+                        shutil.copyfileobj(source, destination, _READ_BUFFER_SIZE)
+                compressed = source.tell()
+        except Exception:
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, target)
+        if segment.stat().st_size != compressed:
+            LOGGER.warning("Keeping %s uncompressed: it grew while being compressed", segment)
+            target.unlink(missing_ok=True)
+            return
+        segment.unlink()
+    except Exception:
+        LOGGER.warning("Failed to compress audit segment %s; keeping it uncompressed", segment, exc_info=True)
+    finally:
+        with _COMPRESSIONS_LOCK:
+            _COMPRESSIONS.discard(threading.current_thread())
+
+
+def _iter_segment_lines(segment: Path) -> Iterator[bytes]:
+    """Yield non-blank lines from a rotated segment, decompressing as it streams."""
+
+    if segment.suffix == ".zst":
+        if zstandard is None:
+            LOGGER.warning("Skipping %s: install certifai[speedups] to read zstd audit segments", segment)
+            return
+        with segment.open("rb") as raw, zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+            yield from _stripped_lines(io.BufferedReader(reader, _READ_BUFFER_SIZE))
+    elif segment.suffix == ".gz":
+        with gzip.open(segment, "rb") as handle:
+            yield from _stripped_lines(handle)
+    else:
+        # Rotated but not yet compressed, e.g. after an interrupted rotation.
+        try:
+            handle = segment.open("rb", buffering=_READ_BUFFER_SIZE)
+        except FileNotFoundError:
+            # Compression finished between listing and reading the segment.
+            for suffix in (".zst", ".gz"):
+                compressed = segment.with_name(segment.name + suffix)
+                if compressed.exists():
+                    yield from _iter_segment_lines(compressed)
+                    return
+            raise
+        with handle:
+            yield from _stripped_lines(handle)
+
+
+def _stripped_lines(handle: Iterable[bytes]) -> Iterator[bytes]:
+    for line in handle:
+        line = line.strip()
+        if line:
+            yield line
+
+
+_WRITERS: Dict[Path, _LogWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def _writer_for(path: Path) -> _LogWriter:
+    key = path.absolute()
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = _WRITERS[key] = _LogWriter(key)
+        return writer
+
+
+@atexit.register
+def _close_writers() -> None:
+    with _WRITERS_LOCK:
+        for writer in _WRITERS.values():
+            writer.close()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _encode_payload(
+    timestamp: str,
+    ts: int | None,
+    action: str,
+    data: dict[str, object],
+    *,
+    dumps: Callable[[Any], bytes] = dumps_line,
+) -> bytes:
+    if ts is None:
+        return dumps({"timestamp": timestamp, "action": action, "data": data})
+    return dumps({"timestamp": timestamp, "ts": ts, "action": action, "data": data})
+
+
+def _stamp() -> tuple[str, int]:
+    """Return the current time as ``(iso_timestamp, epoch_seconds)``."""
+
+    now = _now()
+    return now.isoformat(), int(now.timestamp())
+
+
+def _encode_entry(action: str, data: dict[str, object], stamp: tuple[str, int] | None = None) -> bytes:
+    timestamp, ts = stamp or _stamp()
+    return _encode_payload(timestamp, ts, action, data)
+
+
+# (log path, fsync, rotate_bytes) -> lines deferred by the innermost audit_batch().
+_BatchKey = tuple[Path, bool, int]
+_ACTIVE_BATCH: ContextVar[Dict[_BatchKey, List[bytes]] | None] = ContextVar("certifai_audit_batch", default=None)
+
+
+@contextmanager
+def audit_batch() -> Iterator[None]:
+    """Defer audit records made inside the block and append them together on exit.
+
+    Each log file then gets one write (and at most one ``fsync``) for the whole
+    block instead of one per ``record_*`` call. Nested blocks join the
+    outermost one. Records are written even if the block raises, since they
+    describe changes that already happened.
+    """
+
+    if _ACTIVE_BATCH.get() is not None:
+        yield
+        return
+    pending: Dict[_BatchKey, List[bytes]] = {}
+    token = _ACTIVE_BATCH.set(pending)
+    try:
+        yield
+    finally:
+        _ACTIVE_BATCH.reset(token)
+        for (path, fsync, rotate_bytes), lines in pending.items():
+            _writer_for(path).submit(lines, fsync=fsync, rotate_bytes=rotate_bytes)
+
+
+def _append_lines(settings: AuditSettings, lines: Sequence[bytes], override: Path | None = None) -> None:
+    if not settings.enabled or not lines:
         return
     path = _log_path(settings, override)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        for record in records:
-            handle.write(json.dumps({
-                "timestamp": record.timestamp,
-                "action": record.action,
-                "data": record.data,
-            }) + "\n")
+    rotate_bytes = max(settings.rotate_mb, 0) * 1024 * 1024
+    batch = _ACTIVE_BATCH.get()
+    if batch is not None:
+        batch.setdefault((path, settings.fsync, rotate_bytes), []).extend(lines)
+        return
+    _writer_for(path).submit(lines, fsync=settings.fsync, rotate_bytes=rotate_bytes)
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _write_records(settings: AuditSettings, records: Iterable[AuditRecord], override: Path | None = None) -> None:
+    if not settings.enabled:
+        return
+    encoded = [record.to_json_bytes() for record in records]
+    if encoded:
+        _append_lines(settings, [b"\n".join(encoded) + b"\n"], override)
 
 
-def _parse_timestamp(value: str | None) -> datetime | None:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        return None
+def _coded_findings(data: dict[str, Any]) -> Iterator[tuple[dict[str, Any], int]]:
+    """Yield ``(finding, severity_code)`` for the findings of a review record."""
+
+    findings = data.get("findings") or []
+    codes = data.get("severity_codes")
+    if not isinstance(codes, list) or len(codes) != len(findings):
+        # Records written before severity codes were stored alongside findings.
+        codes = [None] * len(findings)
+    for finding, code in zip(findings, codes):
+        if not isinstance(finding, dict):
+            continue
+        if type(code) is not int:
+            code = _SEVERITY_ORDER.get(str(finding.get("severity", "info")).lower(), 0)
+        yield finding, code
 
 
 def _summarize_findings(findings: Sequence[dict[str, Any]]) -> FindingsSummary:
-    summary: Dict[str, int] = {
-        "total_issues": 0,
-        "critical": 0,
-        "high": 0,
-        "medium": 0,
-        "low": 0,
-        "info": 0,
-    }
-    for finding in findings:
-        summary["total_issues"] += 1
-        severity = str(finding.get("severity", "info")).lower()
-        if severity in summary:
-            summary[severity] += 1
-    return cast(FindingsSummary, {key: value for key, value in summary.items() if value})
+    counts = Counter(str(finding.get("severity", "info")).lower() for finding in findings)
+    summary: Dict[str, int] = {"total_issues": len(findings)} if findings else {}
+    for severity in reversed(_SEVERITY_NAMES):
+        if counts[severity]:
+            summary[severity] = counts[severity]
+    return cast(FindingsSummary, summary)
 
 
 class Audit:
@@ -114,6 +431,13 @@ class Audit:
         self.settings = settings
         self._registry_root = Path(registry_root) if registry_root else None
         self._override_path = self._resolve_override(override_path)
+        self._log_path = _log_path(settings, override=self._override_path)
+        # artifact -> (offset, length) of its newest agent_review line, built
+        # lazily from the sidecar index and caught up on each lookup.
+        self._latest_reviews: dict[str, tuple[int, int]] = {}
+        self._latest_reviews_end = 0
+        self._latest_reviews_inode: tuple[int, int] | None = None
+        self._latest_reviews_lock = threading.Lock()
 
     def _resolve_override(self, override: Path | None) -> Path | None:
         if override is not None:
@@ -133,7 +457,7 @@ class Audit:
 
     @property
     def log_path(self) -> Path:
-        return _log_path(self.settings, override=self._override_path)
+        return self._log_path
 
     @classmethod
     def load(
@@ -152,12 +476,16 @@ class Audit:
                 enabled=True,
                 log_path=str(DEFAULT_LOG_PATH),
                 dashboard_url=configured.dashboard_url,
+                fsync=configured.fsync,
+                rotate_mb=configured.rotate_mb,
             )
         else:
             settings = AuditSettings(
                 enabled=True,
                 log_path=configured.log_path or str(DEFAULT_LOG_PATH),
                 dashboard_url=configured.dashboard_url,
+                fsync=configured.fsync,
+                rotate_mb=configured.rotate_mb,
             )
 
         return cls(
@@ -209,18 +537,15 @@ class Audit:
             payload.update(metadata)
         if findings_payload:
             payload["findings"] = findings_payload
+            # Parallel to "findings" so readers compare integers without
+            # normalizing severity strings, and findings read back unchanged.
+            payload["severity_codes"] = [
+                _SEVERITY_ORDER.get(str(item.get("severity", "info")).lower(), 0) for item in findings_payload
+            ]
         if summary_payload:
             payload["summary"] = summary_payload
 
-        record = AuditRecord(
-            timestamp=_now_iso(),
-            action="agent_review",
-            data=payload,
-        )
-        _write_records(self.settings, [record], override or self._override_path)
-
-    def _read_records(self) -> List[dict[str, Any]]:
-        return read_audit_log(self.settings, override=self._override_path)
+        _append_lines(self.settings, [_encode_entry("agent_review", payload)], override or self._log_path)
 
     def get_findings(
         self,
@@ -230,39 +555,51 @@ class Audit:
         severity: str | None = None,
         since_days: int = 30,
     ) -> List[dict[str, Any]]:
-        entries = self._read_records()
-        if not entries:
+        path = self.log_path
+        segments = _segments(path)
+        exists = path.exists()
+        if not exists and not segments:
             return []
 
         minimum_threshold: int | None = None
         if severity:
             minimum_threshold = _SEVERITY_ORDER.get(severity.lower())
 
-        cutoff: datetime | None = None
+        cutoff: int | None = None
         if since_days >= 0:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=since_days)
+            cutoff = int((_now() - timedelta(days=since_days)).timestamp())
+
+        # A segment's mtime is when it was rotated, i.e. no older than any
+        # record in it, so segments rotated before the cutoff can be skipped.
+        lines: Iterable[bytes] = chain.from_iterable(
+            _iter_segment_lines(segment)
+            for segment in segments
+            if cutoff is None or segment.stat().st_mtime >= cutoff
+        )
+        if exists:
+            lines = chain(lines, iter_indexed_lines(path, "agent_review", since=cutoff))
 
         findings: list[dict[str, Any]] = []
-        for entry in entries:
-            if entry.get("action") != "agent_review":
+        for line in lines:
+            entry = _decode_line(line)
+            if entry is None or entry.get("action") != "agent_review":
                 continue
             timestamp = entry.get("timestamp")
-            parsed_ts = _parse_timestamp(timestamp)
-            if cutoff and parsed_ts and parsed_ts < cutoff:
-                continue
+            if cutoff is not None:
+                ts = entry.get("ts")
+                if type(ts) is not int:
+                    # Legacy records only carry the ISO timestamp.
+                    ts = timestamp_epoch(timestamp)
+                if ts is not None and ts < cutoff:
+                    continue
             data = entry.get("data") or {}
             if artifact and data.get("artifact") != artifact:
                 continue
             if filepath and data.get("filepath") != filepath:
                 continue
 
-            for finding in data.get("findings") or []:
-                if not isinstance(finding, dict):
-                    continue
-                severity_value = _SEVERITY_ORDER.get(
-                    str(finding.get("severity", "info")).lower(), 0
-                )
-                if minimum_threshold is not None and severity_value < minimum_threshold:
+            for finding, code in _coded_findings(data):
+                if minimum_threshold is not None and code < minimum_threshold:
                     continue
                 findings.append(
                     {
@@ -277,15 +614,66 @@ class Audit:
         return findings
 
     def get_latest_review(self, artifact: str) -> dict[str, Any] | None:
-        entries = self._read_records()
-        for entry in reversed(entries):
-            if entry.get("action") != "agent_review":
-                continue
-            data = entry.get("data") or {}
-            if data.get("artifact") == artifact:
+        path = self.log_path
+        if path.exists():
+            entry = self._latest_review_in_log(path, artifact)
+            if entry is not None:
                 return entry
+        for segment in reversed(_segments(path)):
+            latest: dict[str, Any] | None = None
+            for line in _iter_segment_lines(segment):
+                # Skip other actions without decoding them.
+                if b'"agent_review"' not in line:
+                    continue
+                entry = _decode_line(line)
+                if entry is None or entry.get("action") != "agent_review":
+                    continue
+                if (entry.get("data") or {}).get("artifact") == artifact:
+                    latest = entry
+            if latest is not None:
+                return latest
         return None
 
+    def _latest_review_in_log(self, path: Path, artifact: str) -> dict[str, Any] | None:
+        with path.open("rb", buffering=_READ_BUFFER_SIZE) as log, self._latest_reviews_lock:
+            fd = log.fileno()
+            for _attempt in range(2):
+                self._refresh_latest_reviews(log)
+                location = self._latest_reviews.get(artifact)
+                if location is None:
+                    return None
+                offset, length = location
+                entry = _decode_line(os.pread(fd, length, offset).strip())
+                if entry is not None and (entry.get("data") or {}).get("artifact") == artifact:
+                    return entry
+                # The log was rewritten in place (same inode, not shorter); rebuild.
+                self._latest_reviews_inode = None
+            return None
+
+    def _refresh_latest_reviews(self, log: BinaryIO) -> None:
+        fd = log.fileno()
+        stat = os.fstat(fd)
+        inode = (stat.st_dev, stat.st_ino)
+        end = self._latest_reviews_end
+        if (
+            inode != self._latest_reviews_inode
+            or stat.st_size < end
+            or (end and os.pread(fd, 1, end - 1) != b"\n")
+        ):
+            # First lookup, or the log was truncated or replaced since the last one.
+            self._latest_reviews.clear()
+            self._latest_reviews_end = 0
+            self._latest_reviews_inode = inode
+        for offset, length in iter_indexed_records(log, "agent_review", after=self._latest_reviews_end):
+            entry = _decode_line(os.pread(fd, length, offset).strip())
+            self._latest_reviews_end = offset + length
+            if entry is None:
+                continue
+            data = entry.get("data") or {}
+            name = data.get("artifact")
+            if isinstance(name, str):
+                self._latest_reviews[name] = (offset, length)
+
     def has_blocking_issues(
         self,
         artifact: str,
@@ -297,109 +685,170 @@ class Audit:
         if latest is None:
             return False
         data = latest.get("data") or {}
-        for finding in data.get("findings") or []:
-            if not isinstance(finding, dict):
-                continue
-            severity_value = _SEVERITY_ORDER.get(
-                str(finding.get("severity", "info")).lower(), 0
-            )
-            if severity_value >= threshold:
-                return True
+        # The summary holds at most five counters, so consult it before
+        # walking every finding.
         summary = data.get("summary")
         if isinstance(summary, dict):
             for key, amount in summary.items():
-                if key == "total_issues":
+                # Callers may pass severities in any casing.
+                if key == "total_issues" or not isinstance(amount, int) or amount <= 0:
                     continue
-                if _SEVERITY_ORDER.get(str(key).lower(), 0) >= threshold and isinstance(amount, int) and amount > 0:
+                if _SEVERITY_ORDER.get(str(key).lower(), 0) >= threshold:
                     return True
-        return False
+        return any(code >= threshold for _finding, code in _coded_findings(data))
 
 
 def record_certification(settings: AuditSettings, artifacts: Iterable[CodeArtifact], reviewer: str, notes: str | None, reviewer_kind: str = "human", override: Path | None = None) -> None:
-    records = []
-    for artifact in artifacts:
-        records.append(AuditRecord(
-            timestamp=_now_iso(),
-            action="certify",
-            data={
-                "artifact": artifact.name,
-                "filepath": str(artifact.filepath),
-                "reviewer": reviewer,
-                "kind": reviewer_kind,
-                "scrutiny": artifact.tags.scrutiny.value if artifact.tags.scrutiny else None,
-                "notes": notes,
-                "ai_composed": artifact.tags.ai_composed,
-            },
-        ))
-    _write_records(settings, records, override)
+    if not settings.enabled:
+        return
+    stamp = _stamp()
+    lines = [
+        _encode_entry("certify", {
+            "artifact": artifact.name,
+            "filepath": str(artifact.filepath),
+            "reviewer": reviewer,
+            "kind": reviewer_kind,
+            "scrutiny": artifact.tags.scrutiny.value if artifact.tags.scrutiny else None,
+            "notes": notes,
+            "ai_composed": artifact.tags.ai_composed,
+        }, stamp)
+        for artifact in artifacts
+    ]
+    _append_lines(settings, lines, override)
 
 
 def record_agent_certification(settings: AuditSettings, artifacts: Iterable[CodeArtifact], agent_id: str, notes: str | None, override: Path | None = None) -> None:
-    records = []
-    for artifact in artifacts:
-        records.append(AuditRecord(
-            timestamp=_now_iso(),
-            action="agent-certify",
-            data={
-                "artifact": artifact.name,
-                "filepath": str(artifact.filepath),
-                "agent": agent_id,
-                "scrutiny": artifact.tags.scrutiny.value if artifact.tags.scrutiny else None,
-                "notes": notes,
-                "ai_composed": artifact.tags.ai_composed,
-            },
-        ))
-    _write_records(settings, records, override)
+    if not settings.enabled:
+        return
+    stamp = _stamp()
+    lines = [
+        _encode_entry("agent-certify", {
+            "artifact": artifact.name,
+            "filepath": str(artifact.filepath),
+            "agent": agent_id,
+            "scrutiny": artifact.tags.scrutiny.value if artifact.tags.scrutiny else None,
+            "notes": notes,
+            "ai_composed": artifact.tags.ai_composed,
+        }, stamp)
+        for artifact in artifacts
+    ]
+    _append_lines(settings, lines, override)
 
 
 def record_finalization(settings: AuditSettings, artifacts: Iterable[CodeArtifact], override: Path | None = None) -> None:
-    records = []
-    for artifact in artifacts:
-        records.append(AuditRecord(
-            timestamp=_now_iso(),
-            action="finalize",
-            data={
-                "artifact": artifact.name,
-                "filepath": str(artifact.filepath),
-                "human_certified": artifact.tags.human_certified,
-                "ai_composed": artifact.tags.ai_composed,
-            },
-        ))
-    _write_records(settings, records, override)
+    if not settings.enabled:
+        return
+    stamp = _stamp()
+    lines = [
+        _encode_entry("finalize", {
+            "artifact": artifact.name,
+            "filepath": str(artifact.filepath),
+            "human_certified": artifact.tags.human_certified,
+            "ai_composed": artifact.tags.ai_composed,
+        }, stamp)
+        for artifact in artifacts
+    ]
+    _append_lines(settings, lines, override)
 
 
 def record_enforcement(settings: AuditSettings, status: str, messages: list[str], override: Path | None = None) -> None:
-    record = AuditRecord(
-        timestamp=_now_iso(),
-        action="enforce",
-        data={
-            "status": status,
-            "messages": messages,
-        },
-    )
-    _write_records(settings, [record], override)
+    _append_lines(settings, [_encode_entry("enforce", {"status": status, "messages": messages})], override)
 
 
-def read_audit_log(settings: AuditSettings, limit: Optional[int] = None, override: Path | None = None) -> List[dict[str, object]]:
+def _iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """Yield non-blank lines from ``path`` newest first, reading backwards in blocks."""
+
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(_TAIL_BLOCK_SIZE, position)
+            position -= size
+            handle.seek(position)
+            lines = (handle.read(size) + remainder).split(b"\n")
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                line = line.strip()
+                if line:
+                    yield line
+        remainder = remainder.strip()
+        if remainder:
+            yield remainder
+
+
+def _tail_lines(path: Path, limit: int) -> list[bytes]:
+    """Return the last ``limit`` non-blank lines of ``path`` in file order."""
+
+    lines = list(islice(_iter_lines_reversed(path), limit))
+    lines.reverse()
+    return lines
+
+
+def _decode_line(line: bytes) -> dict[str, Any] | None:
+    try:
+        return loads(line)
+    except JSONDecodeError:
+        LOGGER.warning("Skipping malformed audit log line: %s", line.decode("utf-8", "replace"))
+        return None
+
+
+def iter_audit_log(settings: AuditSettings, override: Path | None = None) -> Iterator[dict[str, object]]:
+    """Yield audit log entries oldest first without loading the whole file.
+
+    Rotated segments are read (and decompressed) before the current log.
+    """
+
     path = _log_path(settings, override)
-    if not path.exists():
-        return []
+    lines: Iterable[bytes] = chain.from_iterable(_iter_segment_lines(segment) for segment in _segments(path))
+    if path.exists():
+        lines = chain(lines, _iter_current_lines(path))
+    for line in lines:
+        entry = _decode_line(line)
+        if entry is not None:
+            yield entry
+
+
+def _iter_current_lines(path: Path) -> Iterator[bytes]:
+    with path.open("rb", buffering=_READ_BUFFER_SIZE) as handle:
+        yield from _stripped_lines(handle)
+
+
+def _decode_lines(lines: Iterable[bytes]) -> list[dict[str, object]]:
+    lines = [line for line in lines if line.strip()]
+    try:
+        return [loads(line) for line in lines]
+    except JSONDecodeError:
+        # Rare: a corrupt line. Redo the batch line by line so only it is skipped.
+        pass
     entries: list[dict[str, object]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        lines = handle.readlines()
-    if limit is not None and limit >= 0:
-        lines = lines[-limit:]
     for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
-            LOGGER.warning("Skipping malformed audit log line: %s", line)
+        entry = _decode_line(line.strip())
+        if entry is not None:
+            entries.append(entry)
     return entries
 
 
+def read_audit_log(settings: AuditSettings, limit: Optional[int] = None, override: Path | None = None) -> List[dict[str, object]]:
+    path = _log_path(settings, override)
+    segments = _segments(path)
+    exists = path.exists()
+    if limit is None or limit < 0:
+        lines: list[bytes] = []
+        for segment in segments:
+            lines.extend(_iter_segment_lines(segment))
+        if exists:
+            lines.extend(path.read_bytes().split(b"\n"))
+        return _decode_lines(lines)
+    lines = _tail_lines(path, limit) if exists else []
+    for segment in reversed(segments):
+        remaining = limit - len(lines)
+        if remaining <= 0:
+            break
+        older = list(_iter_segment_lines(segment))
+        lines[:0] = older[-remaining:]
+    return _decode_lines(lines)
+
+
 def record_reopening(
     settings: AuditSettings,
     artifact: CodeArtifact,
@@ -422,9 +871,4 @@ def record_reopening(
     if new_digest:
         record_data["new_digest"] = new_digest
 
-    record = AuditRecord(
-        timestamp=_now_iso(),
-        action="reopen",
-        data=record_data,
-    )
-    _write_records(settings, [record], override)
+    _append_lines(settings, [_encode_entry("reopen", record_data)], override)
@@ -0,0 +1,234 @@
+"""Sidecar offset index for the append-only audit log.
+
+The index lives next to the log as ``<log>.idx``. A header naming the log file
+it was built from (device and inode) is followed by one fixed-size record per
+log line: ``(offset, length, action_id, ts)``. ``ts`` is the running
+maximum of the line timestamps seen so far (epoch seconds), which keeps the
+column sorted even if concurrent writers commit slightly out of order, so a
+``since`` cutoff can be located with a binary search. Queries then read only
+the lines whose action matches instead of decoding the whole log.
+
+The index is brought up to date lazily whenever it is queried, so logs written
+by older releases (or by other processes) are picked up without any changes to
+the write path.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from .utils.logging import get_logger
+from .utils.serialization import JSONDecodeError, loads
+
+LOGGER = get_logger("audit.index")
+
+RECORD = struct.Struct("<QQII")
+# (magic, format version, log st_dev, log st_ino); record-sized so records stay aligned.
+_HEADER = struct.Struct("<4sIQQ")
+_MAGIC = b"CAIX"
+_VERSION = 1
+_OFFSET = struct.Struct("<Q")
+_TIMESTAMP = struct.Struct("<I")
+_TIMESTAMP_OFFSET = 20
+
+ACTION_IDS: dict[str, int] = {
+    "certify": 1,
+    "agent-certify": 2,
+    "finalize": 3,
+    "enforce": 4,
+    "agent_review": 5,
+    "reopen": 6,
+}
+_UNKNOWN_ACTION = 0
+_READ_BUFFER_SIZE = 64 * 1024
+# Lines whose timestamp cannot be parsed pin the running maximum to the top of
+# the range so that ``since`` queries never skip them.
+_MAX_TIMESTAMP = 0xFFFFFFFF
+
+_LOCK = threading.Lock()
+
+
+def index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def timestamp_epoch(value: object) -> float | None:
+    """Return ``value`` (an ISO-8601 string) as epoch seconds, or ``None``."""
+
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class _Column:
+    """Sequence view over one field of a packed index buffer."""
+
+    __slots__ = ("_buffer", "_count", "_field", "_offset")
+
+    def __init__(self, buffer: bytes | mmap.mmap, count: int, field: struct.Struct, offset: int) -> None:
+        self._buffer = buffer
+        self._count = count
+        self._field = field
+        self._offset = offset
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> int:
+        return self._field.unpack_from(self._buffer, _HEADER.size + position * RECORD.size + self._offset)[0]
+
+
+def _scan(log, start: int, watermark: int) -> bytearray:
+    """Index complete lines of ``log`` from byte ``start`` onwards."""
+
+    packed = bytearray()
+    position = start
+    log.seek(start)
+    for line in log:
+        if not line.endswith(b"\n"):
+            # A writer is mid-append; index the line once it is complete.
+            break
+        action_id = _UNKNOWN_ACTION
+        epoch: int | float | None = None
+        if line.strip():
+            try:
+                entry = loads(line)
+            except JSONDecodeError:
+                entry = None
+            if isinstance(entry, dict):
+                action_id = ACTION_IDS.get(str(entry.get("action")), _UNKNOWN_ACTION)
+                epoch = entry.get("ts")
+                if type(epoch) is not int:
+                    epoch = timestamp_epoch(entry.get("timestamp"))
+        if epoch is None:
+            watermark = _MAX_TIMESTAMP
+        else:
+            watermark = max(watermark, min(max(int(epoch), 0), _MAX_TIMESTAMP))
+        packed += RECORD.pack(position, len(line), action_id, watermark)
+        position += len(line)
+    return packed
+
+
+def _catch_up(log, handle) -> None:
+    stat = os.fstat(log.fileno())
+    header = _HEADER.pack(_MAGIC, _VERSION, stat.st_dev, stat.st_ino)
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(0)
+    if size < _HEADER.size or handle.read(_HEADER.size) != header:
+        # A different (replaced or restored) log, or an index from an older
+        # release: the offsets cannot be trusted, so rebuild from scratch.
+        handle.truncate(0)
+        handle.seek(0)
+        handle.write(header)
+        size = _HEADER.size
+    usable = size - (size - _HEADER.size) % RECORD.size
+    end = 0
+    watermark = 0
+    if usable > _HEADER.size:
+        handle.seek(usable - RECORD.size)
+        offset, length, _action, watermark = RECORD.unpack(handle.read(RECORD.size))
+        end = offset + length
+        log.seek(end - 1)
+        if log.read(1) != b"\n":
+            # The log was truncated or rewritten in place; start over.
+            usable = _HEADER.size
+            end = watermark = 0
+    packed = _scan(log, end, watermark)
+    if usable != size:
+        handle.truncate(usable)
+    if packed:
+        handle.seek(usable)
+        handle.write(packed)
+    handle.flush()
+
+
+def _load(log, path: Path) -> tuple[bytes | mmap.mmap, int]:
+    with _LOCK:
+        try:
+            handle = open(path, "a+b")
+        except OSError as exc:
+            LOGGER.debug("Audit index %s is not writable (%s); indexing in memory", path, exc)
+            packed = bytes(_HEADER.size) + _scan(log, 0, 0)
+            return packed, (len(packed) - _HEADER.size) // RECORD.size
+        with handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            _catch_up(log, handle)
+            size = os.fstat(handle.fileno()).st_size
+            if size < _HEADER.size + RECORD.size:
+                return b"", 0
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ), (size - _HEADER.size) // RECORD.size
+
+
+def iter_records(
+    log: BinaryIO,
+    action: str,
+    *,
+    since: float | None = None,
+    after: int = 0,
+    reverse: bool = False,
+) -> Iterator[tuple[int, int]]:
+    """Yield ``(offset, length)`` of lines in the open ``log`` recorded for ``action``.
+
+    When ``since`` is given, lines whose timestamps are all known to be older
+    than that epoch are skipped via binary search; callers should still check
+    the timestamp of each returned entry. ``after`` skips lines starting before
+    that byte offset. ``reverse`` yields newest first.
+    """
+
+    action_id = ACTION_IDS.get(action)
+    if action_id is None:
+        return
+    buffer, count = _load(log, index_path(Path(log.name)))
+    try:
+        start = 0
+        if since is not None:
+            start = bisect_left(_Column(buffer, count, _TIMESTAMP, _TIMESTAMP_OFFSET), int(since))
+        if after:
+            start = max(start, bisect_left(_Column(buffer, count, _OFFSET, 0), after))
+        positions = range(start, count)
+        if reverse:
+            positions = reversed(positions)
+        for position in positions:
+            offset, length, line_action, _ts = RECORD.unpack_from(buffer, _HEADER.size + position * RECORD.size)
+            if line_action == action_id:
+                yield offset, length
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def iter_lines(
+    log_path: Path,
+    action: str,
+    *,
+    since: float | None = None,
+    reverse: bool = False,
+) -> Iterator[bytes]:
+    """Yield raw log lines recorded for ``action``; see :func:`iter_records`."""
+
+    with open(log_path, "rb", buffering=_READ_BUFFER_SIZE) as log:
+        fd = log.fileno()
+        for offset, length in iter_records(log, action, since=since, reverse=reverse):
+            yield os.pread(fd, length, offset)
+
+
+__all__ = ["ACTION_IDS", "RECORD", "index_path", "iter_lines", "iter_records", "timestamp_epoch"]
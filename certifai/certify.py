@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Sequence
 
 from .decorators import certifai
-from .history import build_history_entry
-from .metadata import MetadataUpdate, update_metadata_blocks
+from .history import build_history_entries
+from .metadata import MetadataUpdate, rewrite_metadata_blocks, update_metadata_blocks
 from .models import CodeArtifact, ReviewerInfo, ScrutinyLevel, TagMetadata  # pyright: ignore[reportUnusedImport]
-from .parser import iter_python_files, parse_file
+from .parser import iter_python_files, may_contain_metadata, parse_file
 from .utils.logging import get_logger
+from .utils.parallel import parallel_map
 from .policy import AgentPermission, AgentSettings, PolicyConfig
 
 LOGGER = get_logger("certify")
@@ -44,26 +47,16 @@ def certify(
     if level is None:
         raise ValueError(f"Unsupported scrutiny level: {scrutiny}")
 
-    for path in resolved_paths:
-        LOGGER.debug("Certifying artifacts in %s", path)
-        artifacts = list(parse_file(path))
-        updates = [
-            artifact
-            for artifact in artifacts
-            if include_existing or artifact.tags.is_pending_certification
-        ]
-        if not updates:
-            continue
-        if _rewrite_metadata_human(path, updates, reviewer, level, notes):
-            refreshed = parse_file(path)
-            lookup = {(artifact.name, artifact.lineno): artifact for artifact in refreshed}
-            lookup_by_name = {artifact.name: artifact for artifact in refreshed}
-            for artifact in updates:
-                key = (artifact.name, artifact.lineno)
-                if key in lookup:
-                    updated_artifacts.append(lookup[key])
-                elif artifact.name in lookup_by_name:
-                    updated_artifacts.append(lookup_by_name[artifact.name])
+    worker = partial(
+        _certify_path,
+        reviewer=reviewer,
+        level=level,
+        notes=notes,
+        include_existing=include_existing,
+        timestamp_dt=datetime.now(timezone.utc),
+    )
+    for refreshed in parallel_map(worker, resolved_paths):
+        updated_artifacts.extend(refreshed)
 
     return updated_artifacts
 
@@ -120,69 +113,98 @@ def certify_agent(
         raise ValueError(f"Unsupported scrutiny level: {scrutiny}")
 
     timestamp_dt = datetime.now(timezone.utc)
-    timestamp = timestamp_dt.isoformat()
 
-    for path in resolved_paths:
-        LOGGER.debug("Agent %s certifying artifacts in %s", agent_id, path)
-        artifacts = list(parse_file(path))
-        updates = [
-            artifact
-            for artifact in artifacts
-            if include_existing or artifact.tags.is_pending_certification
-        ]
-        if not updates:
-            continue
-        updates_payload: list[MetadataUpdate] = []
-        for artifact in updates:
-            decorator_block = artifact.decorator
-            if decorator_block is None:
-                LOGGER.warning(
-                    "Artifact %s at %s lacks metadata decorator; skipping agent certification",
-                    artifact.name,
-                    path,
-                )
-                continue
-            metadata = artifact.tags.clone()
-            metadata.agent_certified = agent_id
-            metadata.scrutiny = level
-            metadata.date = timestamp
-            if notes:
-                metadata.notes = notes
-            metadata.done = False
-            metadata.reviewers.append(
-                ReviewerInfo(
-                    kind="agent",
-                    id=agent_id,
-                    scrutiny=level,
-                    notes=notes,
-                    timestamp=timestamp,
-                )
+    worker = partial(
+        _certify_path_agent,
+        agent_id=agent_id,
+        level=level,
+        notes=notes,
+        include_existing=include_existing,
+        timestamp_dt=timestamp_dt,
+    )
+    for refreshed in parallel_map(worker, resolved_paths):
+        updated_artifacts.extend(refreshed)
+
+    return updated_artifacts
+
+
+def _certify_path(
+    path: Path,
+    *,
+    reviewer: str,
+    level: ScrutinyLevel,
+    notes: str | None,
+    include_existing: bool,
+    timestamp_dt: datetime,
+) -> list[CodeArtifact]:
+    LOGGER.debug("Certifying artifacts in %s", path)
+    if not include_existing and not may_contain_metadata(path):
+        # Undecorated artifacts count as pending but can never be rewritten.
+        return []
+    updates = [
+        artifact
+        for artifact in parse_file(path)
+        if include_existing or artifact.tags.is_pending_certification
+    ]
+    if not updates:
+        return []
+    return _rewrite_metadata_human(path, updates, reviewer, level, notes, timestamp_dt=timestamp_dt) or []
+
+
+def _certify_path_agent(
+    path: Path,
+    *,
+    agent_id: str,
+    level: ScrutinyLevel,
+    notes: str | None,
+    include_existing: bool,
+    timestamp_dt: datetime,
+) -> list[CodeArtifact]:
+    timestamp = timestamp_dt.isoformat()
+    LOGGER.debug("Agent %s certifying artifacts in %s", agent_id, path)
+    if not include_existing and not may_contain_metadata(path):
+        # Undecorated artifacts count as pending but can never be rewritten.
+        return []
+    updates = [
+        artifact
+        for artifact in parse_file(path)
+        if include_existing or artifact.tags.is_pending_certification
+    ]
+    if not updates:
+        return []
+    updates_payload: list[MetadataUpdate] = []
+    reviewer_info = ReviewerInfo(kind="agent", id=agent_id, scrutiny=level, notes=notes, timestamp=timestamp)
+    for artifact in updates:
+        decorator_block = artifact.decorator
+        if decorator_block is None:
+            LOGGER.warning(
+                "Artifact %s at %s lacks metadata decorator; skipping agent certification",
+                artifact.name,
+                path,
             )
-            metadata.history = [
-                build_history_entry(
-                    artifact,
-                    metadata,
-                    timestamp=timestamp_dt,
-                    action=f"agent {agent_id} certified ({level.value})",
-                )
-            ]
-            updates_payload.append((artifact, metadata))
-
-        if not updates_payload:
             continue
+        metadata = replace(
+            artifact.tags,
+            agent_certified=agent_id,
+            scrutiny=level,
+            date=timestamp,
+            notes=notes or artifact.tags.notes,
+            done=False,
+            reviewers=[*artifact.tags.reviewers, reviewer_info],
+        )
+        updates_payload.append((artifact, metadata))
 
-        if update_metadata_blocks(path, updates_payload):
-            refreshed = parse_file(path)
-            lookup = {(artifact.name, artifact.lineno): artifact for artifact in refreshed}
-            lookup_by_name = {artifact.name: artifact for artifact in refreshed}
-            for artifact in updates:
-                key = (artifact.name, artifact.lineno)
-                if key in lookup:
-                    updated_artifacts.append(lookup[key])
-                elif artifact.name in lookup_by_name:
-                    updated_artifacts.append(lookup_by_name[artifact.name])
+    if not updates_payload:
+        return []
+    entries = build_history_entries(
+        updates_payload,
+        timestamp=timestamp_dt,
+        action=f"agent {agent_id} certified ({level.value})",
+    )
+    for (_artifact, metadata), entry in zip(updates_payload, entries):
+        metadata.history = [entry]
 
-    return updated_artifacts
+    return rewrite_metadata_blocks(path, updates_payload, updates) or []
 
 
 def _rewrite_metadata_human(
@@ -191,11 +213,16 @@ def _rewrite_metadata_human(
     reviewer: str,
     scrutiny: ScrutinyLevel,
     notes: str | None,
-) -> bool:
-    timestamp_dt = datetime.now(timezone.utc)
+    *,
+    timestamp_dt: datetime | None = None,
+) -> list[CodeArtifact] | None:
+    if timestamp_dt is None:
+        timestamp_dt = datetime.now(timezone.utc)
     timestamp = timestamp_dt.isoformat()
 
     updates_payload: list[MetadataUpdate] = []
+    # Shared by every artifact in the batch; each metadata copy gets its own list.
+    reviewer_info = ReviewerInfo(kind="human", id=reviewer, scrutiny=scrutiny, notes=notes, timestamp=timestamp)
 
     for artifact in artifacts:
         decorator_block = artifact.decorator
@@ -206,37 +233,27 @@ def _rewrite_metadata_human(
                 path,
             )
             continue
-        metadata = artifact.tags.clone()
-        metadata.done = False
-        metadata.add_reviewer(
-            ReviewerInfo(
-                kind="human",
-                id=reviewer,
-                scrutiny=scrutiny,
-                notes=notes,
-                timestamp=timestamp,
-            )
+        metadata = replace(
+            artifact.tags,
+            scrutiny=scrutiny,
+            date=timestamp,
+            notes=notes or artifact.tags.notes,
+            done=False,
         )
-        metadata.human_certified = reviewer
-        metadata.scrutiny = scrutiny
-        metadata.date = timestamp
-        if notes:
-            metadata.notes = notes
-        metadata.done = False
-        metadata.history = [
-            build_history_entry(
-                artifact,
-                metadata,
-                timestamp=timestamp_dt,
-                action=f"certified by {reviewer} ({scrutiny.value})",
-            )
-        ]
+        metadata.add_reviewer(reviewer_info)
         updates_payload.append((artifact, metadata))
 
     if not updates_payload:
-        return False
+        return None
+    entries = build_history_entries(
+        updates_payload,
+        timestamp=timestamp_dt,
+        action=f"certified by {reviewer} ({scrutiny.value})",
+    )
+    for (_artifact, metadata), entry in zip(updates_payload, entries):
+        metadata.history = [entry]
 
-    return update_metadata_blocks(path, updates_payload)
+    return rewrite_metadata_blocks(path, updates_payload, artifacts)
 
 
 def _rewrite_metadata_agent(
@@ -246,11 +263,15 @@ def _rewrite_metadata_agent(
     scrutiny: ScrutinyLevel,
     notes: str | None,
     permission: AgentPermission,
+    *,
+    timestamp_dt: datetime | None = None,
 ) -> bool:
-    timestamp_dt = datetime.now(timezone.utc)
+    if timestamp_dt is None:
+        timestamp_dt = datetime.now(timezone.utc)
     timestamp = timestamp_dt.isoformat()
 
     updates_payload: list[MetadataUpdate] = []
+    reviewer_info = ReviewerInfo(kind="agent", id=agent_id, scrutiny=scrutiny, notes=notes, timestamp=timestamp)
 
     for artifact in artifacts:
         decorator_block = artifact.decorator
@@ -261,34 +282,27 @@ def _rewrite_metadata_agent(
                 path,
             )
             continue
-        metadata = artifact.tags.clone()
-        metadata.agent_certified = agent_id
-        metadata.scrutiny = scrutiny
-        metadata.date = timestamp
-        if notes:
-            metadata.notes = notes
-        metadata.done = metadata.done and permission.allow_finalize
-        metadata.history = [
-            build_history_entry(
-                artifact,
-                metadata,
-                timestamp=timestamp_dt,
-                action=f"certified by agent {agent_id} ({scrutiny.value})",
-            )
-        ]
-        metadata.add_reviewer(
-            ReviewerInfo(
-                kind="agent",
-                id=agent_id,
-                scrutiny=scrutiny,
-                notes=notes,
-                timestamp=timestamp,
-            )
+        metadata = replace(
+            artifact.tags,
+            agent_certified=agent_id,
+            scrutiny=scrutiny,
+            date=timestamp,
+            notes=notes or artifact.tags.notes,
+            done=artifact.tags.done and permission.allow_finalize,
         )
         updates_payload.append((artifact, metadata))
 
     if not updates_payload:
         return False
+    entries = build_history_entries(
+        updates_payload,
+        timestamp=timestamp_dt,
+        action=f"certified by agent {agent_id} ({scrutiny.value})",
+    )
+    for (_artifact, metadata), entry in zip(updates_payload, entries):
+        metadata.history = [entry]
+        # The history digest predates the agent's own reviewer entry.
+        metadata.add_reviewer(reviewer_info)
 
     return update_metadata_blocks(path, updates_payload)
 
@@ -296,10 +310,10 @@ def _rewrite_metadata_agent(
 def _resolve_agent_permission(settings: AgentSettings, agent_id: str) -> AgentPermission:
     if not settings.enabled:
         raise ValueError(f"Agent certification disabled for {agent_id}")
-    for permission in settings.reviewers:
-        if permission.id == agent_id:
-            return permission
-    raise ValueError(f"Agent {agent_id} is not permitted to certify")
+    permission = settings.permission_for(agent_id)
+    if permission is None:
+        raise ValueError(f"Agent {agent_id} is not permitted to certify")
+    return permission
 
 
 def _resolve_agent_scrutiny(scrutiny: str | None, permission: AgentPermission) -> ScrutinyLevel:
@@ -319,8 +333,4 @@ def _resolve_agent_scrutiny(scrutiny: str | None, permission: AgentPermission) -
 
 
 def _scrutiny_within(level: ScrutinyLevel, limit: ScrutinyLevel) -> bool:
-    order = [ScrutinyLevel.AUTO, ScrutinyLevel.LOW, ScrutinyLevel.MEDIUM, ScrutinyLevel.HIGH]
-    try:
-        return order.index(level) <= order.index(limit)
-    except ValueError:
-        return False
+    return level.rank <= limit.rank
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
-from .audit import record_reopening
-from .digest import compute_artifact_digest
+from .audit import audit_batch, record_reopening
+from .digest import compute_artifact_digests, digest_scheme
 from .metadata import MetadataUpdate, insert_metadata_block, update_metadata_blocks
 from .models import CodeArtifact, TagMetadata
 from .parser import parse_file
@@ -17,10 +19,20 @@ from .registry import (
     load_registry,
     save_registry,
 )
+from .utils.cache import CACHE_DIR, ensure_cache_dir
 from .utils.logging import get_logger
+from .utils.parallel import parallel_map
+from .utils.serialization import JSONDecodeError, dumps_bytes, loads
 
 LOGGER = get_logger("checks")
 
+_DIGEST_CACHE_FILE = CACHE_DIR / "digest_cache.json"
+# Bump whenever compute_artifact_digests changes so stale digests are dropped.
+_DIGEST_CACHE_VERSION = 3
+# Files modified this recently are not cached: a second write within the same
+# filesystem timestamp tick could leave (mtime, size) unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 def _metadata_from_entry(entry: RegistryEntry) -> TagMetadata:
     """Create minimal Stage 1 metadata when reopening an artifact."""
@@ -31,6 +43,70 @@ def _metadata_from_entry(entry: RegistryEntry) -> TagMetadata:
     )
 
 
+def _registered_digests(job: Tuple[str, Dict[str, str]]) -> Dict[str, str]:
+    """Return current digests for the registered artifact names in one file.
+
+    ``job`` maps each wanted name to the digest scheme of its registry entry,
+    so the results compare directly with the stored digests.
+    """
+
+    filepath_str, schemes = job
+    artifacts = [artifact for artifact in parse_file(Path(filepath_str)) if artifact.name in schemes]
+    digests = compute_artifact_digests(artifacts, schemes=[schemes[artifact.name] for artifact in artifacts])
+    return {artifact.name: digest for artifact, digest in zip(artifacts, digests)}
+
+
+def _digest_cache_path(registry_root: Path | None) -> Path:
+    base = Path.cwd() if registry_root is None else registry_root
+    return base / _DIGEST_CACHE_FILE
+
+
+def _load_digest_cache(path: Path) -> Dict[str, Any]:
+    """Return ``{filepath: {"signature": [mtime_ns, size], "digests": {...}}}``."""
+
+    try:
+        raw = loads(path.read_bytes())
+    except (OSError, JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != _DIGEST_CACHE_VERSION:
+        return {}
+    files = raw.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_digest_cache(path: Path, files: Dict[str, Any]) -> None:
+    temporary = path.with_name(path.name + ".tmp")
+    try:
+        ensure_cache_dir(path.parent)
+        temporary.write_bytes(dumps_bytes({"version": _DIGEST_CACHE_VERSION, "files": files}))
+        os.replace(temporary, path)
+    except OSError as exc:
+        LOGGER.debug("Could not write digest cache %s: %s", path, exc)
+
+
+def _cached_digests(cached: Any, signature: list[int], schemes: Dict[str, str]) -> Dict[str, str] | None:
+    """Return cached digests if they cover ``schemes`` for an unchanged file."""
+
+    if not isinstance(cached, dict) or cached.get("signature") != signature:
+        return None
+    digests = cached.get("digests")
+    if not isinstance(digests, dict):
+        return None
+    for name, scheme in schemes.items():
+        digest = digests.get(name)
+        if digest is None or digest_scheme(digest) != scheme:
+            return None
+    return digests
+
+
+def _find_artifact(path: Path, qualified_name: str) -> CodeArtifact | None:
+    found: CodeArtifact | None = None
+    for artifact in parse_file(path):
+        if artifact.name == qualified_name:
+            found = artifact
+    return found
+
+
 def reconcile_registry(registry_root: Path | None = None) -> List[Path]:
     """Ensure finalized artifacts still match registered digests.
 
@@ -49,69 +125,98 @@ def reconcile_registry(registry_root: Path | None = None) -> List[Path]:
     policy = load_policy()
     audit_settings = policy.integrations.audit
 
-    updated_files: set[Path] = set()
-    for key, entry in list(registry.items()):
-        filepath_str, qualified_name = key
-        path = Path(filepath_str)
-        if not path.exists():
-            LOGGER.warning("Registered artifact missing: %s", filepath_str)
-            registry.pop(key, None)
+    # Digesting is the expensive, read-only part and files are independent, so
+    # it fans out across processes; rewrites below stay sequential. Files whose
+    # (mtime, size) match the digest cache from a previous run are not parsed.
+    schemes_by_file: Dict[str, Dict[str, str]] = {}
+    for (filepath_str, qualified_name), entry in registry.items():
+        schemes_by_file.setdefault(filepath_str, {})[qualified_name] = digest_scheme(entry.digest)
+    cache_path = _digest_cache_path(registry_root)
+    cached_files = _load_digest_cache(cache_path)
+    current_digests: Dict[str, Dict[str, str]] = {}
+    signatures: Dict[str, list[int]] = {}
+    jobs: list[Tuple[str, Dict[str, str]]] = []
+    for filepath_str, schemes in schemes_by_file.items():
+        try:
+            stat = os.stat(filepath_str)
+        except OSError:
             continue
-
-        artifacts = parse_file(path)
-        artifact_map: Dict[str, CodeArtifact] = {artifact.name: artifact for artifact in artifacts}
-        artifact = artifact_map.get(qualified_name)
-        if artifact is None:
-            LOGGER.info("Artifact %s removed from %s; clearing registry entry", qualified_name, filepath_str)
-            registry.pop(key, None)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = _cached_digests(cached_files.get(filepath_str), signature, schemes)
+        if cached is not None:
+            current_digests[filepath_str] = cached
             continue
-
-        digest = compute_artifact_digest(artifact)
-        if digest == entry.digest:
-            continue
-
-        LOGGER.info("Artifact %s in %s changed; reopening for review", qualified_name, filepath_str)
-        metadata = _metadata_from_entry(entry)
-        updates: list[MetadataUpdate] = [(artifact, metadata)]
-        if update_metadata_blocks(path, updates):
-            archive_registry_entry(
-                registry,
-                key,
-                entry,
-                reason="code_changed",
-                old_digest=entry.digest,
-                new_digest=digest,
-            )
-            registry.pop(key, None)
-            updated_files.add(path)
-            record_reopening(
-                audit_settings,
-                artifact,
-                "digest_mismatch",
-                old_digest=entry.digest,
-                new_digest=digest,
-            )
-        elif insert_metadata_block(path, artifact, metadata):
-            archive_registry_entry(
-                registry,
-                key,
-                entry,
-                reason="code_changed",
-                old_digest=entry.digest,
-                new_digest=digest,
-            )
-            registry.pop(key, None)
-            updated_files.add(path)
-            record_reopening(
-                audit_settings,
-                artifact,
-                "digest_mismatch",
-                old_digest=entry.digest,
-                new_digest=digest,
-            )
-        else:
-            LOGGER.warning("Failed to update metadata for %s", filepath_str)
+        signatures[filepath_str] = signature
+        jobs.append((filepath_str, schemes))
+    current_digests.update(zip((filepath_str for filepath_str, _schemes in jobs), parallel_map(_registered_digests, jobs)))
+
+    # Keyed by the registry's path string so the common no-drift path never builds a Path.
+    updated_files: Dict[str, Path] = {}
+    # Reopenings are audited in one append rather than one per drifted artifact.
+    with audit_batch():
+        for key, entry in list(registry.items()):
+            filepath_str, qualified_name = key
+            if filepath_str not in current_digests:
+                LOGGER.warning("Registered artifact missing: %s", filepath_str)
+                registry.pop(key, None)
+                continue
+
+            digest = current_digests[filepath_str].get(qualified_name)
+            if digest == entry.digest:
+                continue
+            path = updated_files.get(filepath_str) or Path(filepath_str)
+            # Re-parse here: earlier reopenings in the same file shift line numbers.
+            artifact = None if digest is None else _find_artifact(path, qualified_name)
+            if artifact is None:
+                LOGGER.info("Artifact %s removed from %s; clearing registry entry", qualified_name, filepath_str)
+                registry.pop(key, None)
+                continue
+
+            LOGGER.info("Artifact %s in %s changed; reopening for review", qualified_name, filepath_str)
+            metadata = _metadata_from_entry(entry)
+            updates: list[MetadataUpdate] = [(artifact, metadata)]
+            if update_metadata_blocks(path, updates) or insert_metadata_block(path, artifact, metadata):
+                archive_registry_entry(
+                    registry,
+                    key,
+                    entry,
+                    reason="code_changed",
+                    old_digest=entry.digest,
+                    new_digest=digest,
+                )
+                registry.pop(key, None)
+                updated_files[filepath_str] = path
+                record_reopening(
+                    audit_settings,
+                    artifact,
+                    "digest_mismatch",
+                    old_digest=entry.digest,
+                    new_digest=digest,
+                )
+            else:
+                LOGGER.warning("Failed to update metadata for %s", filepath_str)
 
     if updated_files:
         save_registry(registry, registry_root)
-    return sorted(updated_files)
+    if jobs or cached_files.keys() - current_digests.keys():
+        _save_digest_cache(cache_path, _refreshed_digest_cache(current_digests, cached_files, signatures, updated_files))
+    return sorted(updated_files.values())
+
+
+def _refreshed_digest_cache(
+    current_digests: Dict[str, Dict[str, str]],
+    cached_files: Dict[str, Any],
+    signatures: Dict[str, list[int]],
+    updated_files: Dict[str, Path],
+) -> Dict[str, Any]:
+    """Keep cache entries for registered files, adding freshly computed digests."""
+
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    refreshed: Dict[str, Any] = {}
+    for filepath_str, digests in current_digests.items():
+        signature = signatures.get(filepath_str)
+        if signature is None:
+            refreshed[filepath_str] = cached_files[filepath_str]
+        elif filepath_str not in updated_files and signature[0] < racy_after:
+            refreshed[filepath_str] = {"signature": signature, "digests": digests}
+    return refreshed
@@ -6,41 +6,48 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Literal, Optional, cast
+from typing import Iterable, Iterator, Literal, Optional, cast
 
 import click
 
 from . import __version__
 from .decorators import certifai
-from .certify import certify as certify_artifacts
-from .certify import certify_agent as certify_artifacts_agent
-from .certify import verify_all as verify_artifacts
-from .checks import reconcile_registry
-from .finalize import finalize as finalize_artifacts
-from .integrations.github import build_pr_status
-from .integrations.security import run_all_scanners
-from .publishing import publish_report
-from .audit import (
-    Audit,
-    record_certification,
-    record_agent_certification,
-    record_finalization,
-    record_enforcement,
-    read_audit_log,
-)
-from .enforce import enforce_ci
-from .policy import load_policy
-from .provenance import annotate_paths
-from .report import (
-    build_summary,
-    emit_csv_report,
-    emit_markdown_table,
-    emit_text_report,
-)
-from .utils.logging import get_logger
 from .models import ScrutinyLevel
+from .utils.serialization import dumps_indented
+
+# Command implementations pull in YAML, GitPython and the parsers; they are
+# imported inside each command so that --help and --version stay fast.
+
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+
+# Stateless, so one instance serves every path argument and option.
+_PATH = click.Path(path_type=Path)
+
+
+class _InternChoice(click.Choice):
+    """``click.Choice`` with a hashed lookup that returns the interned choice."""
+
+    def __init__(self, choices: tuple[str, ...]) -> None:
+        super().__init__(tuple(map(sys.intern, choices)))
+        self._interned = {choice: choice for choice in self.choices}
+
+    def convert(self, value, param, ctx):  # type: ignore[no-untyped-def]
+        if isinstance(value, str):
+            interned = self._interned.get(value)
+            if interned is not None:
+                return interned
+        # Misses fall through so click still reports the usual "invalid choice" error.
+        return super().convert(value, param, ctx)
+
+
+_REPORT_FORMATS = _InternChoice(("text", "json", "csv", "md"))
+_OUTPUT_FORMATS = _InternChoice(("json", "pretty"))
+
+_NO_AUDIT = click.option("--no-audit", is_flag=True, help="Skip audit log writes for this invocation.")
 
-LOGGER = get_logger("cli")
+# (shields.io colour, minimum coverage percent), checked in order.
+_BADGE_COLORS = (("green", 80), ("orange", 50), ("red", 0))
 
 
 @certifai(
@@ -54,8 +61,12 @@ LOGGER = get_logger("cli")
     ],
 )
 def _configure_logging(verbose: bool) -> None:
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="[%(levelname)s] %(message)s")
+    # Same contract as logging.basicConfig: leave an already-configured root alone.
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.addHandler(_LOG_HANDLER)
 
 
 @certifai(
@@ -88,22 +99,26 @@ def cli(verbose: bool) -> None:
     ],
 )
 @cli.command()
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 @click.option("--ai-agent", default="pending", show_default=True, help="Label to use for @ai_composed metadata.")
 @click.option("--notes", default="auto-tagged by certifai", show_default=True, help="Notes text to include when inserting metadata.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Path to a .certifai.yml policy file.")
+@click.option("--policy", type=_PATH, help="Path to a .certifai.yml policy file.")
 def annotate(paths: tuple[Path, ...], ai_agent: str, notes: str, policy: Path | None) -> None:
     """Insert provenance metadata for unannotated artifacts."""
 
+    from .policy import load_policy
+    from .provenance import annotate_paths
+
     target_paths = paths or (Path.cwd(),)
     policy_config = load_policy(policy) if policy else load_policy()
     result = annotate_paths(target_paths, ai_agent=ai_agent, default_notes=notes, policy=policy_config)
-    click.echo(f"Processed {len(result.artifacts)} artifacts across {len(target_paths)} path(s).")
+    # One write per stream: a violation-heavy run would otherwise flush once per line.
+    lines = [f"Processed {len(result.artifacts)} artifacts across {len(target_paths)} path(s)."]
     if result.updated_files:
-        click.echo(f"Updated files: {len(result.updated_files)}")
+        lines.append(f"Updated files: {len(result.updated_files)}")
+    click.echo("\n".join(lines))
     if result.policy_violations:
-        for violation in result.policy_violations:
-            click.echo(f"Policy violation: {violation}", err=True)
+        click.echo("\n".join(f"Policy violation: {violation}" for violation in result.policy_violations), err=True)
         raise SystemExit(1)
 
 
@@ -118,16 +133,21 @@ def annotate(paths: tuple[Path, ...], ai_agent: str, notes: str, policy: Path |
     ],
 )
 @cli.command()
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 @click.option("--reviewer", required=True, help="Reviewer identifier (human or agent).")
 @click.option("--scrutiny", required=True, help="Target scrutiny level (auto|low|medium|high).")
 @click.option("--notes", help="Optional notes appended to metadata.")
 @click.option("--include-existing", is_flag=True, help="Also refresh artifacts that are already certified.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
 @click.option("--agent", is_flag=True, help="Treat the reviewer as a configured review agent." )
-def certify(paths: tuple[Path, ...], reviewer: str, scrutiny: str, notes: str | None, include_existing: bool, policy: Path | None, agent: bool) -> None:
+@_NO_AUDIT
+def certify(paths: tuple[Path, ...], reviewer: str, scrutiny: str, notes: str | None, include_existing: bool, policy: Path | None, agent: bool, no_audit: bool) -> None:
     """Certify selected artifacts."""
 
+    from .audit import record_certification
+    from .certify import certify as certify_artifacts
+    from .policy import load_policy
+
     target_paths = paths or (Path.cwd(),)
     policy_config = load_policy(policy)
     reviewer_kind = "agent" if agent else "human"
@@ -140,15 +160,14 @@ def certify(paths: tuple[Path, ...], reviewer: str, scrutiny: str, notes: str |
         agent_settings = policy_config.integrations.agents
         if not agent_settings.enabled:
             raise click.ClickException("Agent-based certification is disabled in the current policy.")
-        permission = next((item for item in agent_settings.reviewers if item.id == reviewer), None)
+        permission = agent_settings.permission_for(reviewer)
         if permission is None:
             raise click.ClickException(f"Agent '{reviewer}' is not registered in policy integrations.agents.reviewers.")
         if permission.max_scrutiny:
             allowed_level = ScrutinyLevel.from_string(permission.max_scrutiny)
             if allowed_level is None:
                 raise click.ClickException(f"Invalid max_scrutiny '{permission.max_scrutiny}' configured for agent {reviewer}.")
-            order = {ScrutinyLevel.AUTO: 0, ScrutinyLevel.LOW: 1, ScrutinyLevel.MEDIUM: 2, ScrutinyLevel.HIGH: 3}
-            if order[requested_level] > order[allowed_level]:
+            if requested_level.rank > allowed_level.rank:
                 raise click.ClickException(
                     f"Agent '{reviewer}' may not certify '{scrutiny}' scrutiny (max allowed: {permission.max_scrutiny})."
                 )
@@ -162,39 +181,45 @@ def certify(paths: tuple[Path, ...], reviewer: str, scrutiny: str, notes: str |
         reviewer_kind=reviewer_kind,
     )
     click.echo(f"Certified {len(updated)} artifact(s).")
-    record_certification(policy_config.integrations.audit, updated, reviewer, notes, reviewer_kind=reviewer_kind)
+    if not no_audit:
+        record_certification(policy_config.integrations.audit, updated, reviewer, notes, reviewer_kind=reviewer_kind)
 
 
 @cli.command("certify-agent")
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 @click.option("--agent", "agent_id", required=True, help="Agent identifier for certification.")
 @click.option("--scrutiny", required=True, help="Target scrutiny level (auto|low|medium|high).")
 @click.option("--notes", help="Optional notes appended to metadata.")
 @click.option("--include-existing", is_flag=True, help="Also refresh artifacts that are already certified.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
-def certify_agent_cmd(paths: tuple[Path, ...], agent_id: str, scrutiny: str, notes: str | None, include_existing: bool, policy: Path | None) -> None:
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
+@_NO_AUDIT
+def certify_agent_cmd(paths: tuple[Path, ...], agent_id: str, scrutiny: str, notes: str | None, include_existing: bool, policy: Path | None, no_audit: bool) -> None:
     """Certify selected artifacts using a trusted agent."""
 
+    from .audit import record_certification
+    from .certify import certify_agent as certify_artifacts_agent
+    from .policy import load_policy
+
     target_paths = paths or (Path.cwd(),)
     policy_config = load_policy(policy)
     if not policy_config.integrations.agents.enabled:
         raise SystemExit("Agent certification is not enabled in the current policy.")
-    allowed_agents = {perm.id: perm for perm in policy_config.integrations.agents.reviewers}
-    if agent_id not in allowed_agents:
+    permission = policy_config.integrations.agents.permission_for(agent_id)
+    if permission is None:
         raise SystemExit(f"Agent {agent_id} is not permitted by policy.")
-    max_scrutiny = allowed_agents[agent_id].max_scrutiny
+    max_scrutiny = permission.max_scrutiny
     if max_scrutiny:
         level = ScrutinyLevel.from_string(scrutiny)
         max_level = ScrutinyLevel.from_string(max_scrutiny)
         if level is None or max_level is None:
             raise SystemExit("Invalid scrutiny level in agent policy configuration.")
-        order = [ScrutinyLevel.AUTO, ScrutinyLevel.LOW, ScrutinyLevel.MEDIUM, ScrutinyLevel.HIGH]
-        if order.index(level) > order.index(max_level):
+        if level.rank > max_level.rank:
             raise SystemExit(f"Agent {agent_id} is not allowed to certify at {scrutiny} scrutiny (max {max_scrutiny}).")
 
     updated = certify_artifacts_agent(target_paths, agent_id, scrutiny, notes=notes, include_existing=include_existing)
     click.echo(f"Agent {agent_id} certified {len(updated)} artifact(s).")
-    record_certification(policy_config.integrations.audit, updated, agent_id, notes)
+    if not no_audit:
+        record_certification(policy_config.integrations.audit, updated, agent_id, notes)
 
 
 @cli.group()
@@ -203,15 +228,19 @@ def agent() -> None:
 
 
 @agent.command("certify")
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 @click.option("--agent-id", required=True, help="Identifier for the review agent.")
 @click.option("--scrutiny", required=True, help="Scrutiny level applied by the agent (auto|low|medium|high).")
 @click.option("--notes", help="Optional notes recorded for this agent review.")
 @click.option("--include-existing", is_flag=True, help="Also update artifacts already reviewed by this agent.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
 def agent_certify(paths: tuple[Path, ...], agent_id: str, scrutiny: str, notes: str | None, include_existing: bool, policy: Path | None) -> None:
     """Record agent certification for selected artifacts."""
 
+    from .audit import record_agent_certification
+    from .certify import certify_agent as certify_agent_artifacts
+    from .policy import load_policy
+
     target_paths = paths or (Path.cwd(),)
     policy_config = load_policy(policy)
     updated = certify_agent_artifacts(target_paths, agent_id, scrutiny, notes=notes, include_existing=include_existing)
@@ -220,10 +249,11 @@ def agent_certify(paths: tuple[Path, ...], agent_id: str, scrutiny: str, notes:
 
 
 @cli.command()
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
-@click.option("--registry-root", type=click.Path(path_type=Path), help="Optional base path for the registry manifest.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
-def finalize(paths: tuple[Path, ...], registry_root: Path | None, policy: Path | None) -> None:
+@click.argument("paths", nargs=-1, type=_PATH)
+@click.option("--registry-root", type=_PATH, help="Optional base path for the registry manifest.")
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
+@_NO_AUDIT
+def finalize(paths: tuple[Path, ...], registry_root: Path | None, policy: Path | None, no_audit: bool) -> None:
     """Finalize reviewed artifacts by moving provenance into the registry.
 
     Steps performed:
@@ -231,18 +261,23 @@ def finalize(paths: tuple[Path, ...], registry_root: Path | None, policy: Path |
     2. Computes AST digests for change detection
     3. Stores complete provenance (reviewers, history) in .certifai/registry.yml
     4. Removes @certifai decorators from source code
-    5. Logs finalization activity to the audit log
+    5. Logs finalization activity to the audit log (unless ``--no-audit``)
     """
 
+    from .audit import record_finalization
+    from .finalize import finalize as finalize_artifacts
+    from .policy import load_policy
+
     target_paths = paths or (Path.cwd(),)
     policy_config = load_policy(policy)
     finalized = finalize_artifacts(target_paths, registry_root=registry_root)
     click.echo(f"Finalized {len(finalized)} artifact(s).")
-    record_finalization(policy_config.integrations.audit, finalized)
+    if not no_audit:
+        record_finalization(policy_config.integrations.audit, finalized)
 
 
 @cli.command()
-@click.option("--registry-root", type=click.Path(path_type=Path), help="Root directory for registry files.")
+@click.option("--registry-root", type=_PATH, help="Root directory for registry files.")
 def check(registry_root: Path | None) -> None:
     """Reconcile finalized artifacts and reopen drifted code for review.
 
@@ -253,6 +288,8 @@ def check(registry_root: Path | None) -> None:
     4. Logs reopening events to the audit log
     """
 
+    from .checks import reconcile_registry
+
     reopened = reconcile_registry(registry_root=registry_root)
     if reopened:
         click.echo("Reopened artifacts in:")
@@ -263,7 +300,7 @@ def check(registry_root: Path | None) -> None:
 
 
 @cli.command()
-@click.argument("path", type=click.Path(path_type=Path))
+@click.argument("path", type=_PATH)
 @click.option(
     "--severity",
     type=click.Choice(["critical", "high", "medium", "low", "info"]),
@@ -276,10 +313,10 @@ def check(registry_root: Path | None) -> None:
     show_default=True,
     help="Limit findings to the last N days (-1 for all).",
 )
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
 @click.option(
     "--registry-root",
-    type=click.Path(path_type=Path),
+    type=_PATH,
     help="Optional base path used to resolve registry and audit files.",
 )
 def findings(
@@ -291,6 +328,9 @@ def findings(
 ) -> None:
     """Show recent agent findings recorded for a path."""
 
+    from .audit import Audit
+    from .policy import load_policy
+
     policy_config = load_policy(policy)
     audit = Audit.from_settings(policy_config.integrations.audit, registry_root=registry_root)
     if not audit.enabled:
@@ -324,10 +364,10 @@ def findings(
 
 @cli.command("review-status")
 @click.argument("artifact")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to a policy file.")
+@click.option("--policy", type=_PATH, help="Optional path to a policy file.")
 @click.option(
     "--registry-root",
-    type=click.Path(path_type=Path),
+    type=_PATH,
     help="Optional base path used to resolve registry and audit files.",
 )
 @click.option(
@@ -345,6 +385,9 @@ def review_status(
 ) -> None:
     """Show the latest agent review status for an artifact."""
 
+    from .audit import Audit
+    from .policy import load_policy
+
     policy_config = load_policy(policy)
     audit = Audit.from_settings(policy_config.integrations.audit, registry_root=registry_root)
     if not audit.enabled:
@@ -388,7 +431,7 @@ def review_status(
 
 
 @cli.command()
-@click.argument("path", type=click.Path(path_type=Path))
+@click.argument("path", type=_PATH)
 @click.option("--artifact", help="Specific function/class to track (e.g., 'MyClass.method').")
 @click.option("--ai-composed", help="AI model that composed this code.")
 @click.option("--reason", help="Reason for tracking this artifact.")
@@ -432,6 +475,8 @@ def verify() -> None:
 def verify_all(reviewer: str, scrutiny: str | None) -> None:
     """Verify all pending artifacts."""
 
+    from .certify import verify_all as verify_artifacts
+
     updated = verify_artifacts(reviewer, scrutiny=scrutiny)
     click.echo(f"Verified {len(updated)} artifact(s).")
 
@@ -447,27 +492,33 @@ def verify_all(reviewer: str, scrutiny: str | None) -> None:
     ],
 )
 @cli.command()
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["text", "json", "csv", "md"]),
+    type=_REPORT_FORMATS,
     default="text",
     show_default=True,
 )
 def report(paths: tuple[Path, ...], output_format: str) -> None:
     """Generate a certification coverage report."""
 
+    from .report import build_summary_cached, emit_csv_report, emit_markdown_table, emit_text_report
+
     target_paths = paths or (Path.cwd(),)
-    summary = build_summary(target_paths)
+    summary = build_summary_cached(target_paths)
     if output_format == "json":
-        click.echo(json.dumps(summary.to_dict(), indent=2, default=str))
-    elif output_format == "csv":
-        click.echo(emit_csv_report(summary))
-    elif output_format == "md":
-        click.echo(emit_markdown_table(summary))
-    else:
-        click.echo(emit_text_report(summary))
+        payload = dumps_indented(summary.to_dict(), default=str) + b"\n"
+        binary = getattr(sys.stdout, "buffer", None)
+        if binary is None:
+            # Text-only stdout, e.g. redirect_stdout() or a notebook.
+            click.echo(payload.decode("utf-8"), nl=False)
+            return
+        sys.stdout.flush()
+        binary.write(payload)
+        return
+    emitter = {"csv": emit_csv_report, "md": emit_markdown_table}.get(output_format, emit_text_report)
+    emitter(summary, file=sys.stdout)
 
 
 @certifai(
@@ -481,20 +532,41 @@ def report(paths: tuple[Path, ...], output_format: str) -> None:
     ],
 )
 @cli.command()
-@click.argument("paths", nargs=-1, type=click.Path(path_type=Path))
+@click.argument("paths", nargs=-1, type=_PATH)
 def badge(paths: tuple[Path, ...]) -> None:
     """Output a Markdown badge for current certification coverage."""
 
+    from .report import compute_coverage_ratio
+
     target_paths = paths or (Path.cwd(),)
-    summary = build_summary(target_paths)
-    coverage_percent = round(summary.coverage_ratio * 100, 1)
-    coverage_str = f"{coverage_percent:.1f}".rstrip("0").rstrip(".")
-    color = "green" if coverage_percent >= 80 else "orange" if coverage_percent >= 50 else "red"
-    badge_url = (
-        "https://img.shields.io/badge/" +
-        f"Human_Certified-{coverage_str}%25-{color}"
+    coverage_percent = round(compute_coverage_ratio(target_paths) * 100, 1)
+    color = next(color for color, cutoff in _BADGE_COLORS if coverage_percent >= cutoff)
+    # ``g`` drops a trailing ".0" without the rstrip passes; values carry one decimal at most.
+    click.echo(
+        f"![certifai Coverage](https://img.shields.io/badge/Human_Certified-{coverage_percent:g}%25-{color})"
     )
-    click.echo(f"![certifai Coverage]({badge_url})")
+
+
+def _iter_paths_file(paths_file: Path | None) -> Iterator[str]:
+    """Yield the non-blank, stripped lines of ``paths_file`` (``-`` for stdin)."""
+
+    if paths_file is None:
+        return
+    if str(paths_file) == "-":
+        yield from (line.strip() for line in sys.stdin if line.strip())
+        return
+    with paths_file.open(encoding="utf-8") as handle:
+        yield from (line.strip() for line in handle if line.strip())
+
+
+def _echo_payload(payload: object, output: str) -> None:
+    """Print a command's JSON payload: compact, or indented with sorted keys for ``pretty``."""
+
+    if output == "pretty":
+        # Indented output bypasses json's C encoder; orjson keeps it fast when installed.
+        click.echo(dumps_indented(payload, sort_keys=True))
+    else:
+        click.echo(json.dumps(payload))
 
 
 @cli.group()
@@ -503,21 +575,19 @@ def pr() -> None:
 
 
 @pr.command("status")
-@click.option("--path", "paths", multiple=True, type=click.Path(path_type=Path), help="File or directory to analyse (repeatable). Defaults to repository root.")
-@click.option("--paths-file", type=click.Path(path_type=Path), help="File containing newline-delimited paths to include. Use '-' to read from stdin.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to policy file.")
-@click.option("--output", type=click.Choice(["json", "pretty"]), default="json", show_default=True, help="Output format.")
+@click.option("--path", "paths", multiple=True, type=_PATH, help="File or directory to analyse (repeatable). Defaults to repository root.")
+@click.option("--paths-file", type=_PATH, help="File containing newline-delimited paths to include. Use '-' to read from stdin.")
+@click.option("--policy", type=_PATH, help="Optional path to policy file.")
+@click.option("--output", type=_OUTPUT_FORMATS, default="json", show_default=True, help="Output format.")
 def pr_status(paths: tuple[Path, ...], paths_file: Path | None, policy: Path | None, output: str) -> None:
     """Emit a JSON status summary for pull request automation."""
 
+    from .integrations.github import build_pr_status
+    from .policy import load_policy
+
     aggregated_paths: list[Path | str] = list(paths)
 
-    if paths_file is not None:
-        if str(paths_file) == "-":
-            content = sys.stdin.read().splitlines()
-        else:
-            content = paths_file.read_text(encoding="utf-8").splitlines()
-        aggregated_paths.extend(line.strip() for line in content if line.strip())
+    aggregated_paths.extend(_iter_paths_file(paths_file))
 
     if not aggregated_paths:
         aggregated_paths = [Path.cwd()]
@@ -525,8 +595,7 @@ def pr_status(paths: tuple[Path, ...], paths_file: Path | None, policy: Path | N
     policy_config = load_policy(policy)
     status_payload = build_pr_status(aggregated_paths, policy_config)
 
-    indent = 2 if output == "pretty" else None
-    click.echo(json.dumps(status_payload, indent=indent, sort_keys=output == "pretty"))
+    _echo_payload(status_payload, output)
 
 
 @cli.group()
@@ -535,23 +604,21 @@ def security() -> None:
 
 
 @security.command("run")
-@click.option("--path", "paths", multiple=True, type=click.Path(path_type=Path), help="File or directory to scan (repeatable).")
-@click.option("--paths-file", type=click.Path(path_type=Path), help="File containing newline-delimited paths to scan. Use '-' to read from stdin.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to policy file.")
-@click.option("--output", type=click.Choice(["json", "pretty"]), default="json", show_default=True, help="Output format.")
+@click.option("--path", "paths", multiple=True, type=_PATH, help="File or directory to scan (repeatable).")
+@click.option("--paths-file", type=_PATH, help="File containing newline-delimited paths to scan. Use '-' to read from stdin.")
+@click.option("--policy", type=_PATH, help="Optional path to policy file.")
+@click.option("--output", type=_OUTPUT_FORMATS, default="json", show_default=True, help="Output format.")
 def security_run(paths: tuple[Path, ...], paths_file: Path | None, policy: Path | None, output: str) -> None:
     """Run configured security scanners and emit a JSON summary."""
 
+    from .integrations.security import run_all_scanners
+    from .policy import load_policy
+
     policy_config = load_policy(policy)
     settings = policy_config.integrations.security
     aggregated_paths: list[Path | str] = list(paths)
 
-    if paths_file is not None:
-        if str(paths_file) == "-":
-            content = sys.stdin.read().splitlines()
-        else:
-            content = paths_file.read_text(encoding="utf-8").splitlines()
-        aggregated_paths.extend(line.strip() for line in content if line.strip())
+    aggregated_paths.extend(_iter_paths_file(paths_file))
 
     if not aggregated_paths:
         aggregated_paths = [Path.cwd()]
@@ -572,8 +639,7 @@ def security_run(paths: tuple[Path, ...], paths_file: Path | None, policy: Path
         "status": "pass" if all(result.exit_code == 0 for result in results) else "fail",
     }
 
-    indent = 2 if output == "pretty" else None
-    click.echo(json.dumps(payload, indent=indent, sort_keys=output == "pretty"))
+    _echo_payload(payload, output)
 
 
 @cli.group()
@@ -582,12 +648,15 @@ def publish() -> None:
 
 
 @publish.command("report")
-@click.option("--path", "paths", multiple=True, type=click.Path(path_type=Path), help="File or directory to include in the report (repeatable). Defaults to repository root.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to policy file.")
-@click.option("--output", type=click.Choice(["json", "pretty"]), default="json", show_default=True, help="Output format.")
+@click.option("--path", "paths", multiple=True, type=_PATH, help="File or directory to include in the report (repeatable). Defaults to repository root.")
+@click.option("--policy", type=_PATH, help="Optional path to policy file.")
+@click.option("--output", type=_OUTPUT_FORMATS, default="json", show_default=True, help="Output format.")
 def publish_report_cmd(paths: tuple[Path, ...], policy: Path | None, output: str) -> None:
     """Publish coverage reports to configured destinations."""
 
+    from .policy import load_policy
+    from .publishing import publish_report
+
     target_paths = list(paths) or [Path.cwd()]
     policy_config = load_policy(policy)
     results = publish_report([Path(p) for p in target_paths], policy_config)
@@ -597,29 +666,33 @@ def publish_report_cmd(paths: tuple[Path, ...], policy: Path | None, output: str
         "destinations": results,
     }
 
-    indent = 2 if output == "pretty" else None
-    click.echo(json.dumps(payload, indent=indent, sort_keys=output == "pretty"))
+    _echo_payload(payload, output)
 
 
 @cli.command()
-@click.option("--path", "paths", multiple=True, type=click.Path(path_type=Path), help="File or directory to evaluate (repeatable). Defaults to repository root.")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to policy file.")
-@click.option("--output", type=click.Choice(["json", "pretty"]), default="json", show_default=True, help="Output format.")
-def enforce(paths: tuple[Path, ...], policy: Path | None, output: str) -> None:
+@click.option("--path", "paths", multiple=True, type=_PATH, help="File or directory to evaluate (repeatable). Defaults to repository root.")
+@click.option("--policy", type=_PATH, help="Optional path to policy file.")
+@click.option("--output", type=_OUTPUT_FORMATS, default="json", show_default=True, help="Output format.")
+@_NO_AUDIT
+def enforce(paths: tuple[Path, ...], policy: Path | None, output: str, no_audit: bool) -> None:
     """Run CI enforcement checks (coverage, policy, security)."""
 
+    from .audit import record_enforcement
+    from .enforce import enforce_ci
+    from .policy import load_policy
+
     target_paths = list(paths) or [Path.cwd()]
     policy_config = load_policy(policy)
     result = enforce_ci([Path(p) for p in target_paths], policy_config)
 
-    indent = 2 if output == "pretty" else None
-    click.echo(json.dumps({
+    _echo_payload({
         "status": result.status,
         "messages": result.messages,
         "payload": result.payload,
-    }, indent=indent, sort_keys=output == "pretty"))
+    }, output)
 
-    record_enforcement(policy_config.integrations.audit, result.status, result.messages)
+    if not no_audit:
+        record_enforcement(policy_config.integrations.audit, result.status, result.messages)
     if result.status != "pass":
         raise SystemExit(1)
 
@@ -630,18 +703,40 @@ def audit() -> None:
 
 
 @audit.command("show")
-@click.option("--policy", type=click.Path(path_type=Path), help="Optional path to policy file.")
-@click.option("--log-path", type=click.Path(path_type=Path), help="Override audit log path.")
+@click.option("--policy", type=_PATH, help="Optional path to policy file.")
+@click.option("--log-path", type=_PATH, help="Override audit log path.")
 @click.option("--limit", type=int, default=-1, show_default=True, help="Number of most recent entries to display (-1 for all).")
-@click.option("--output", type=click.Choice(["json", "pretty"]), default="json", show_default=True, help="Output format.")
+@click.option("--output", type=_OUTPUT_FORMATS, default="json", show_default=True, help="Output format.")
 def audit_show(policy: Path | None, log_path: Path | None, limit: int, output: str) -> None:
     """Show audit log entries."""
 
+    from .audit import iter_audit_log, read_audit_log
+    from .policy import load_policy
+
     policy_config = load_policy(policy)
-    effective_limit = None if limit < 0 else limit
-    entries = read_audit_log(policy_config.integrations.audit, limit=effective_limit, override=log_path)
-    indent = 2 if output == "pretty" else None
-    click.echo(json.dumps(entries, indent=indent, sort_keys=output == "pretty"))
+    settings = policy_config.integrations.audit
+    if limit < 0:
+        # The whole log can be large: decode and print it one entry at a time.
+        entries: Iterable[dict[str, object]] = iter_audit_log(settings, override=log_path)
+    else:
+        entries = read_audit_log(settings, limit=limit, override=log_path)
+    _write_json_array(entries, pretty=output == "pretty")
+
+
+def _write_json_array(entries: Iterable[dict[str, object]], *, pretty: bool) -> None:
+    """Write ``entries`` as ``json.dumps(list(entries), ...)`` would, one element at a time."""
+
+    write = sys.stdout.write
+    opening, separator, closing = ("[\n  ", ",\n  ", "\n]\n") if pretty else ("[", ", ", "]\n")
+    prefix = opening
+    for entry in entries:
+        if pretty:
+            # Strings never contain raw newlines in JSON, so this only shifts structure.
+            write(prefix + json.dumps(entry, indent=2, sort_keys=True).replace("\n", "\n  "))
+        else:
+            write(prefix + json.dumps(entry))
+        prefix = separator
+    write("[]\n" if prefix is opening else closing)
 
 
 @certifai(
@@ -670,18 +765,22 @@ def config() -> None:
     ],
 )
 @config.command("show")
-@click.option("--path", type=click.Path(path_type=Path), help="Optional path to a policy file.")
+@click.option("--path", type=_PATH, help="Optional path to a policy file.")
 def config_show(path: Path | None) -> None:
     """Display the effective policy configuration."""
 
+    from .policy import load_policy
+
     policy = load_policy(path)
-    click.echo(json.dumps({
+    enforcement = policy.enforcement
+    # Both JSON backends encode the reviewers tuple as an array without a list copy.
+    click.echo(dumps_indented({
         "enforcement": {
-            "ai_composed_requires_high_scrutiny": policy.enforcement.ai_composed_requires_high_scrutiny,
-            "min_coverage": policy.enforcement.min_coverage,
+            "ai_composed_requires_high_scrutiny": enforcement.ai_composed_requires_high_scrutiny,
+            "min_coverage": enforcement.min_coverage,
         },
-        "reviewers": list(policy.reviewers),
-    }, indent=2))
+        "reviewers": policy.reviewers,
+    }))
 
 
 @certifai(
@@ -699,6 +798,10 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     try:
         args = list(argv) if argv is not None else sys.argv[1:]
+        if args == ["--version"]:
+            # Matches click.version_option's output without building a context.
+            click.echo(f"certifai, version {__version__}")
+            return 0
         cli.main(args=args, prog_name="certifai")
     except SystemExit as exc:
         return exc.code
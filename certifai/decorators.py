@@ -10,12 +10,16 @@ from .models import ScrutinyLevel, TagMetadata
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# What json.dumps uses for a str under its default options, minus the encoder
+# dispatch around it.
+_encode_string: Callable[[str], str] = json.encoder.encode_basestring_ascii  # type: ignore[attr-defined]
+
 PROVENANCE_DECORATOR_NAME = "certifai"
-PROVENANCE_DECORATOR_ALIASES = {
+PROVENANCE_DECORATOR_ALIASES = frozenset({
     PROVENANCE_DECORATOR_NAME,
     f"decorators.{PROVENANCE_DECORATOR_NAME}",
     f"certifai.decorators.{PROVENANCE_DECORATOR_NAME}",
-}
+})
 
 
 def certifai(
@@ -30,10 +34,12 @@ def certifai(
 ) -> Callable[[F], F]:
     """Runtime no-op decorator used to attach provenance metadata."""
 
-    def _decorator(target: F) -> F:
-        return target
+    return _identity
+
 
-    return _decorator
+def _identity(target: F) -> F:
+    # Shared by every @certifai(...) so decorating allocates no closure.
+    return target
 
 
 def decorator_name(node: ast.AST) -> str | None:
@@ -54,11 +60,19 @@ def decorator_name(node: ast.AST) -> str | None:
 
 
 def is_metadata_decorator(node: ast.AST) -> bool:
-    name = decorator_name(node)
-    if name is None:
+    # Equivalent to checking the last component of decorator_name(node), and
+    # every alias ends in the decorator name, but no dotted string is built:
+    # this runs for every decorator in every scanned file.
+    while isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id == PROVENANCE_DECORATOR_NAME
+    if not isinstance(node, ast.Attribute) or node.attr != PROVENANCE_DECORATOR_NAME:
         return False
-    short_name = name.split(".")[-1]
-    return short_name == PROVENANCE_DECORATOR_NAME or name in PROVENANCE_DECORATOR_ALIASES
+    current: ast.AST = node.value
+    while isinstance(current, ast.Attribute):
+        current = current.value
+    return isinstance(current, ast.Name)
 
 
 def metadata_from_decorator(node: ast.AST) -> TagMetadata:
@@ -123,9 +137,13 @@ def format_metadata_decorator(metadata: TagMetadata, indent: str = "") -> list[s
 
 
 def _format_sequence(name: str, values: Iterable[Any], indent: str) -> list[str]:
+    item_indent = f"{indent}        "
     nested: list[str] = [f"{indent}    {name}=["]
-    for item in values:
-        nested.append(f"{indent}        {_format_value(item)},")
+    # History entries are plain strings; encode them without the generic dispatch.
+    nested.extend(
+        f"{item_indent}{_encode_string(item) if type(item) is str else _format_value(item)},"
+        for item in values
+    )
     nested.append(f"{indent}    ],")
     return nested
 
@@ -134,7 +152,7 @@ def _format_value(value: Any) -> str:
     if isinstance(value, ScrutinyLevel):
         return _format_value(value.value)
     if isinstance(value, str):
-        return json.dumps(value)
+        return _encode_string(value)
     if isinstance(value, (list, tuple)):
         inner = ", ".join(_format_value(item) for item in value)
         return f"[{inner}]"
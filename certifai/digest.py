@@ -4,33 +4,159 @@ from __future__ import annotations
 
 import ast
 import hashlib
+import os
 import textwrap
 from pathlib import Path
+from typing import Callable, Iterable, Sequence
 
 from .models import CodeArtifact
+from .utils.logging import get_logger
+
+LOGGER = get_logger("digest")
 
 
 def _artifact_source(artifact: CodeArtifact, *, source: str | None = None) -> str:
     if source is None:
         source = artifact.filepath.read_text(encoding="utf-8")
-    lines = source.splitlines()
+    return _artifact_snippet(artifact, source.splitlines())
+
+
+def _artifact_snippet(artifact: CodeArtifact, lines: Sequence[str]) -> str:
     start_index = max(artifact.start_line - 1, 0)
     end_line = artifact.end_lineno or artifact.lineno
     last_line_index = min(len(lines), max(end_line, artifact.lineno)) - 1
     snippet = "\n".join(lines[start_index:last_line_index + 1])
-    return textwrap.dedent(snippet).strip()
-
-
-def compute_artifact_digest(artifact: CodeArtifact, *, source: str | None = None) -> str:
-    """Return a stable digest representing the artifact's implementation."""
-
-    snippet = _artifact_source(artifact, source=source)
-    if not snippet:
-        return hashlib.sha256(b"").hexdigest()
-    try:
-        tree = ast.parse(snippet)
-        normalised = ast.dump(tree, include_attributes=False)
-    except SyntaxError:
-        normalised = snippet
-    digest = hashlib.sha256(normalised.encode("utf-8")).hexdigest()
-    return digest
+    if not snippet or snippet[0].isspace():
+        return textwrap.dedent(snippet).strip()
+    # Module-level artifacts have no margin to remove. dedent would still blank
+    # whitespace-only lines, which only matters for the raw-text fallback in
+    # _digest_snippet, and that fallback dedents again.
+    return snippet.rstrip()
+
+
+_LEGACY_SCHEME = "sha256"
+_DEFAULT_SCHEME = "blake2b"
+_HASHERS = {
+    # Registries written before digests carried a scheme prefix hold bare
+    # SHA-256 hex strings of ``ast.dump`` output; those must keep verifying.
+    _LEGACY_SCHEME: hashlib.sha256,
+    _DEFAULT_SCHEME: lambda: hashlib.blake2b(digest_size=20),
+}
+_SCHEME_ENV = "CERTIFAI_DIGEST_ALGO"
+
+
+def _configured_scheme() -> str:
+    scheme = os.environ.get(_SCHEME_ENV, "").strip()
+    if not scheme:
+        return _DEFAULT_SCHEME
+    if scheme not in _HASHERS:
+        LOGGER.warning("Ignoring unknown %s=%r; using %s", _SCHEME_ENV, scheme, _DEFAULT_SCHEME)
+        return _DEFAULT_SCHEME
+    return scheme
+
+
+DIGEST_SCHEME = _configured_scheme()
+"""Scheme used for newly computed digests; stored as ``"<scheme>:<hex>"``.
+
+Set ``CERTIFAI_DIGEST_ALGO=sha256`` to keep writing the older scheme while
+tools that cannot read the newer one are still in use.
+"""
+
+
+def digest_scheme(digest: str | None) -> str:
+    """Return the scheme a stored digest was computed with."""
+
+    if digest:
+        scheme, separator, _value = digest.partition(":")
+        if separator and scheme in _HASHERS:
+            return scheme
+    return _LEGACY_SCHEME
+
+
+def compute_artifact_digest(
+    artifact: CodeArtifact,
+    *,
+    source: str | None = None,
+    scheme: str = DIGEST_SCHEME,
+) -> str:
+    """Return a stable digest representing the artifact's implementation.
+
+    Pass ``scheme=digest_scheme(stored)`` to produce a digest comparable with a
+    previously stored one.
+    """
+
+    return _digest_snippet(_artifact_source(artifact, source=source), scheme)
+
+
+def compute_artifact_digests(
+    artifacts: Iterable[CodeArtifact],
+    *,
+    schemes: Sequence[str] | None = None,
+) -> list[str]:
+    """Return :func:`compute_artifact_digest` for each artifact, in order.
+
+    Each source file is read and split into lines once, however many of the
+    artifacts it holds. ``schemes``, when given, pairs a digest scheme with
+    each artifact; otherwise :data:`DIGEST_SCHEME` is used throughout.
+    """
+
+    lines_by_path: dict[Path, list[str]] = {}
+    digests: list[str] = []
+    for index, artifact in enumerate(artifacts):
+        lines = lines_by_path.get(artifact.filepath)
+        if lines is None:
+            lines = lines_by_path[artifact.filepath] = artifact.filepath.read_text(encoding="utf-8").splitlines()
+        scheme = DIGEST_SCHEME if schemes is None else schemes[index]
+        digests.append(_digest_snippet(_artifact_snippet(artifact, lines), scheme))
+    return digests
+
+
+def _digest_snippet(snippet: str, scheme: str) -> str:
+    hasher = _HASHERS[scheme]()
+    if snippet:
+        try:
+            tree = ast.parse(snippet)
+        except SyntaxError:
+            hasher.update(textwrap.dedent(snippet).strip().encode("utf-8"))
+        else:
+            if scheme == _LEGACY_SCHEME:
+                hasher.update(ast.dump(tree, include_attributes=False).encode("utf-8"))
+            else:
+                _hash_ast(tree, hasher.update)
+    value = hasher.hexdigest()
+    if scheme == _LEGACY_SCHEME:
+        return value
+    return f"{scheme}:{value}"
+
+
+def _hash_ast(node: ast.AST, update: Callable[[bytes], None]) -> None:
+    """Feed a canonical form of ``node`` to ``update`` without building a dump string.
+
+    Positions are ignored, as with ``ast.dump(include_attributes=False)``.
+    Fields that are ``None`` or empty are skipped, so fields added by newer
+    Python versions do not change the digest of code that does not use them.
+    """
+
+    update(type(node).__name__.encode())
+    update(b"(")
+    for name in node._fields:
+        value = getattr(node, name, None)
+        if value is None or value == []:
+            continue
+        update(name.encode())
+        update(b"=")
+        if isinstance(value, ast.AST):
+            _hash_ast(value, update)
+        elif isinstance(value, list):
+            update(b"[")
+            for item in value:
+                if isinstance(item, ast.AST):
+                    _hash_ast(item, update)
+                else:
+                    update(repr(item).encode())
+                update(b",")
+            update(b"]")
+        else:
+            update(repr(value).encode())
+        update(b";")
+    update(b")")
@@ -28,7 +28,7 @@ def enforce_ci(paths: Sequence[Path], policy: PolicyConfig) -> EnforcementResult
     status = "pass"
 
     summary = build_summary(paths)
-    pr_status_payload = build_pr_status(paths, policy)
+    pr_status_payload = build_pr_status(paths, policy, summary=summary)
 
     if pr_status_payload.get("status") != "pass":
         status = "fail"
@@ -39,6 +39,7 @@ def enforce_ci(paths: Sequence[Path], policy: PolicyConfig) -> EnforcementResult
         status = "fail"
         messages.append("Security scanners reported issues.")
 
+    output_limit = policy.integrations.security.max_output_chars
     payload = {
         "pr_status": pr_status_payload,
         "security": [
@@ -46,9 +47,10 @@ def enforce_ci(paths: Sequence[Path], policy: PolicyConfig) -> EnforcementResult
                 "name": result.name,
                 "command": result.command,
                 "exit_code": result.exit_code,
-                "findings": result.findings,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                # Unparsed findings are the stdout text itself.
+                "findings": _clip(result.findings, output_limit) if isinstance(result.findings, str) else result.findings,
+                "stdout": _clip(result.stdout, output_limit),
+                "stderr": _clip(result.stderr, output_limit),
             }
             for result in security_results
         ],
@@ -59,3 +61,11 @@ def enforce_ci(paths: Sequence[Path], policy: PolicyConfig) -> EnforcementResult
         messages.append("All enforcement checks passed.")
 
     return EnforcementResult(status=status, messages=messages, payload=payload)
+
+
+def _clip(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters (``0`` keeps it whole), noting how much was dropped."""
+
+    if limit <= 0 or len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [truncated {len(text) - limit} chars]"
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from .digest import compute_artifact_digest
+from .digest import compute_artifact_digests
 from .metadata import remove_metadata_blocks
 from .models import CodeArtifact
-from .parser import iter_python_files, parse_file
+from .parser import iter_python_files, may_contain_metadata, parse_file
 from .registry import RegistryEntry, load_registry, save_registry, update_registry
 from .utils.logging import get_logger
+from .utils.parallel import parallel_map
 
 LOGGER = get_logger("finalize")
 
@@ -30,36 +32,43 @@ def finalize(paths: Iterable[Path | str], *, registry_root: Path | None = None)
     registry = load_registry(registry_root)
     resolved_paths = list(iter_python_files(paths))
     finalized: list[CodeArtifact] = []
-    now = datetime.now(timezone.utc)
+    worker = partial(_finalize_path, now=datetime.now(timezone.utc))
 
-    for path in resolved_paths:
-        artifacts = list(parse_file(path))
-        removal_updates: list[CodeArtifact] = []
-        registry_updates: list[tuple[CodeArtifact, RegistryEntry]] = []
+    # Files are parsed, digested and rewritten independently across processes;
+    # the shared registry is only updated here.
+    for registry_updates in parallel_map(worker, resolved_paths):
+        if registry_updates:
+            finalized.extend(artifact for artifact, _entry in registry_updates)
+            update_registry(registry, registry_updates)
+
+    if finalized:
+        save_registry(registry, registry_root)
+    return finalized
+
+
+def _finalize_path(path: Path, *, now: datetime) -> list[tuple[CodeArtifact, RegistryEntry]]:
+    """Strip the decorators of finalizable artifacts in ``path`` and return their registry entries."""
 
-        for artifact in artifacts:
-            if not _finalizable(artifact):
-                continue
-            digest = compute_artifact_digest(artifact)
-            entry = RegistryEntry.from_artifact_full(
+    if not may_contain_metadata(path):
+        # Undecorated artifacts are never human-certified.
+        return []
+    candidates = [artifact for artifact in parse_file(path) if _finalizable(artifact)]
+    if not candidates:
+        return []
+    registry_updates = [
+        (
+            artifact,
+            RegistryEntry.from_artifact_full(
                 artifact,
                 artifact.tags,
                 digest,
                 timestamp=now,
                 include_reviewers=True,
-            )
-            registry_updates.append((artifact, entry))
-            removal_updates.append(artifact)
-
-        if not removal_updates:
-            continue
-
-        if remove_metadata_blocks(path, removal_updates):
-            finalized.extend(removal_updates)
-            update_registry(registry, registry_updates)
-        else:
-            LOGGER.warning("Failed to update metadata blocks for %s", path)
-
-    if finalized:
-        save_registry(registry, registry_root)
-    return finalized
+            ),
+        )
+        for artifact, digest in zip(candidates, compute_artifact_digests(candidates))
+    ]
+    if not remove_metadata_blocks(path, candidates):
+        LOGGER.warning("Failed to update metadata blocks for %s", path)
+        return []
+    return registry_updates
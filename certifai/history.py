@@ -5,11 +5,15 @@ from __future__ import annotations
 import hashlib
 import re
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence
+
+from git import Commit
 
 from .decorators import certifai
 from .models import CodeArtifact, TagMetadata
-from .utils.git import describe_line, get_repo
+from .utils.git import blame_commits, commit_info, describe_line, get_repo
 
 _DIGEST_PATTERN = re.compile(r"digest=([0-9a-f]{40})")
 
@@ -27,7 +31,7 @@ _DIGEST_PATTERN = re.compile(r"digest=([0-9a-f]{40})")
 def compute_digest(metadata: TagMetadata) -> str:
     """Return a stable digest representing the metadata content."""
 
-    parts: list[str] = [
+    return _digest_parts((
         metadata.ai_composed or "",
         metadata.human_certified or "",
         metadata.scrutiny.value if metadata.scrutiny else "",
@@ -36,9 +40,14 @@ def compute_digest(metadata: TagMetadata) -> str:
         "\n".join(metadata.extras),
         "\n".join(metadata.agents),
         "done" if metadata.done else "",
-    ]
-    joined = "|".join(parts)
-    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _digest_parts(parts: tuple[str, ...]) -> str:
+    # The same metadata is digested when checking an existing history entry
+    # and again when writing the new one; a cache hit skips the join and SHA-1.
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
 
 
 @certifai(
@@ -81,22 +90,54 @@ def build_history_entry(
 ) -> str:
     """Construct a single history entry describing metadata provenance."""
 
-    digest = compute_digest(metadata)
     ts = (timestamp or datetime.now(timezone.utc)).isoformat()
-    segments = [ts, f"digest={digest}"]
-    if action:
-        segments.append(action)
+    info = describe_line(artifact.filepath, artifact.lineno)
+    return _format_entry(ts, metadata, action, _last_commit_segment(artifact, info))
 
-    commit_info = describe_line(artifact.filepath, artifact.lineno)
-    if commit_info:
-        segments.append(
-            f"last_commit={commit_info['commit'][:7]} by {commit_info['author']}"
-        )
-    else:
-        repo = get_repo(artifact.filepath)
-        if repo is not None and repo.is_dirty(path=str(artifact.filepath)):
-            segments.append("last_commit=uncommitted")
+
+def build_history_entries(
+    updates: Sequence[tuple[CodeArtifact, TagMetadata]],
+    *,
+    timestamp: datetime | None = None,
+    action: str | None = None,
+) -> list[str]:
+    """Build :func:`build_history_entry` output for many artifacts at once.
+
+    Git is consulted once per file (a single blame and at most one dirty
+    check) rather than once per artifact.
+    """
+
+    ts = (timestamp or datetime.now(timezone.utc)).isoformat()
+    blames: dict[Path, list[Commit] | None] = {}
+    fallbacks: dict[Path, str] = {}
+    entries: list[str] = []
+    for artifact, metadata in updates:
+        path = artifact.filepath
+        if path not in blames:
+            blames[path] = blame_commits(path)
+        commits = blames[path]
+        if commits is not None and 1 <= artifact.lineno <= len(commits):
+            segment = _last_commit_segment(artifact, commit_info(commits[artifact.lineno - 1]))
         else:
-            segments.append("last_commit=unknown")
+            if path not in fallbacks:
+                fallbacks[path] = _last_commit_segment(artifact, None)
+            segment = fallbacks[path]
+        entries.append(_format_entry(ts, metadata, action, segment))
+    return entries
+
 
+def _format_entry(ts: str, metadata: TagMetadata, action: str | None, last_commit: str) -> str:
+    segments = [ts, f"digest={compute_digest(metadata)}"]
+    if action:
+        segments.append(action)
+    segments.append(last_commit)
     return " ".join(segments)
+
+
+def _last_commit_segment(artifact: CodeArtifact, info: dict[str, str] | None) -> str:
+    if info:
+        return f"last_commit={info['commit'][:7]} by {info['author']}"
+    repo = get_repo(artifact.filepath)
+    if repo is not None and repo.is_dirty(path=str(artifact.filepath)):
+        return "last_commit=uncommitted"
+    return "last_commit=unknown"
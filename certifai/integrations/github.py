@@ -5,9 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from ..models import CodeArtifact, ScrutinyLevel
+from ..models import CodeArtifact
 from ..policy import PolicyConfig
-from ..provenance import enforce_policy
+from ..provenance import certification_check, enforce_policy
 from ..report import CoverageSummary, build_summary
 
 
@@ -30,32 +30,28 @@ def _evaluate_summary(summary: CoverageSummary, policy: PolicyConfig) -> dict[st
 
     min_coverage = policy.enforcement.min_coverage
     total_functions = summary.total_functions
-    allowed_agents = {perm.id: perm for perm in policy.integrations.agents.reviewers}
-
-    def _is_certified(artifact: CodeArtifact) -> bool:
-        if artifact.tags.human_certified and artifact.tags.human_certified.lower() != "pending":
-            return True
-        for reviewer in artifact.tags.reviewers:
-            if reviewer.kind == "human" and reviewer.id and reviewer.id.lower() != "pending":
-                return True
-            if reviewer.kind == "agent" and reviewer.id in allowed_agents:
-                perm = allowed_agents[reviewer.id]
-                max_level = ScrutinyLevel.from_string(perm.max_scrutiny) if perm.max_scrutiny else None
-                if max_level is None:
-                    return True
-                agent_level = reviewer.scrutiny or ScrutinyLevel.AUTO
-                order = [ScrutinyLevel.AUTO, ScrutinyLevel.LOW, ScrutinyLevel.MEDIUM, ScrutinyLevel.HIGH]
-                if order.index(agent_level) <= order.index(max_level):
-                    return True
-        return False
-
-    covered = sum(1 for artifact in summary.artifacts if _is_certified(artifact))
-    pending = [artifact for artifact in summary.artifacts if not _is_certified(artifact)]
-    ai_pending = [artifact for artifact in pending if artifact.tags.ai_composed]
-    agent_only = [
-        artifact for artifact in summary.artifacts if artifact.tags.agents and not artifact.tags.human_certified
-    ]
-    finalized = [artifact for artifact in summary.artifacts if artifact.tags.done]
+    is_certified = certification_check(policy)
+
+    # Every bucket is filled in a single pass over the artifacts, and an
+    # artifact listed in several buckets shares one descriptor between them.
+    pending: list[dict[str, object]] = []
+    ai_pending: list[dict[str, object]] = []
+    agent_only: list[dict[str, object]] = []
+    finalized: list[dict[str, object]] = []
+    for artifact in summary.artifacts:
+        tags = artifact.tags
+        descriptor: dict[str, object] | None = None
+        if not is_certified(artifact):
+            descriptor = _artifact_descriptor(artifact)
+            pending.append(descriptor)
+            if tags.ai_composed:
+                ai_pending.append(descriptor)
+        if tags.agents and not tags.human_certified:
+            descriptor = descriptor or _artifact_descriptor(artifact)
+            agent_only.append(descriptor)
+        if tags.done:
+            finalized.append(descriptor or _artifact_descriptor(artifact))
+    covered = len(summary.artifacts) - len(pending)
     coverage_ratio = (covered / total_functions) if total_functions else 1.0
     agent_ratio = summary.agent_certified / total_functions if total_functions else 0.0
     coverage_ok = (
@@ -142,17 +138,32 @@ def _evaluate_summary(summary: CoverageSummary, policy: PolicyConfig) -> dict[st
             "agent_only": len(agent_only),
         },
         "violations": violations,
-        "pending_artifacts": [_artifact_descriptor(artifact) for artifact in pending],
-        "ai_pending_artifacts": [_artifact_descriptor(artifact) for artifact in ai_pending],
-        "agent_only_artifacts": [_artifact_descriptor(artifact) for artifact in agent_only],
-        "finalized_artifacts": [_artifact_descriptor(artifact) for artifact in finalized],
+        "pending_artifacts": pending,
+        "ai_pending_artifacts": ai_pending,
+        "agent_only_artifacts": agent_only,
+        "finalized_artifacts": finalized,
         "checks": checks,
     }
 
 
-def build_pr_status(paths: Iterable[Path | str], policy: PolicyConfig) -> dict[str, object]:
-    resolved_paths = list(_normalise_paths(paths)) or [Path.cwd()]
-    summary = build_summary(resolved_paths)
+def build_pr_status(
+    paths: Iterable[Path | str],
+    policy: PolicyConfig,
+    *,
+    summary: CoverageSummary | None = None,
+) -> dict[str, object]:
+    """Evaluate coverage and policy for ``paths`` as a PR status payload.
+
+    ``summary`` may be a :func:`build_summary` result the caller already has
+    for ``paths``; it is reused unless some paths are missing and the scan
+    would cover a different set of files.
+    """
+
+    requested = list(paths)
+    resolved_paths = _normalise_paths(requested)
+    if summary is None or not resolved_paths or len(resolved_paths) != len(requested):
+        resolved_paths = resolved_paths or [Path.cwd()]
+        summary = build_summary(resolved_paths)
     evaluation = _evaluate_summary(summary, policy)
     evaluation["paths"] = {
         "evaluated": sorted({str(Path(path)) for path in resolved_paths}),
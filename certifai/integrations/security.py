@@ -6,15 +6,21 @@ import json
 import os
 import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Iterable, Mapping, Sequence
 
 from ..policy import SecurityScannerConfig, SecurityScannerSettings
 from ..utils.logging import get_logger
+from ..utils.serialization import JSONDecodeError, loads
 
 LOGGER = get_logger("security")
 
+# Every first character json.loads accepts, including its NaN/Infinity literals.
+_JSON_START = frozenset('{["-0123456789tfnNI')
+
 
 @dataclass(slots=True)
 class ScannerInvocation:
@@ -28,6 +34,9 @@ class ScannerInvocation:
 
 def _prepare_command(command: str, targets: Sequence[str]) -> list[str]:
     # Allow commands to reference {targets} as a placeholder, otherwise append targets to the end.
+    if "{" not in command and "}" not in command:
+        # Nothing to format, so the tokens never depend on the targets.
+        return [*_split_command(command), *targets]
     formatted = command.format(targets=" ".join(shlex.quote(item) for item in targets))
     parts = shlex.split(formatted)
     if "{targets}" not in command and targets:
@@ -35,12 +44,45 @@ def _prepare_command(command: str, targets: Sequence[str]) -> list[str]:
     return parts
 
 
-def run_scanner(config: SecurityScannerConfig, targets: Sequence[str]) -> ScannerInvocation:
-    args = _prepare_command(config.command, targets)
-    LOGGER.debug("Running security scanner %s", config.name)
+@lru_cache(maxsize=64)
+def _split_command(command: str) -> tuple[str, ...]:
+    return tuple(shlex.split(command))
+
+
+def _decode_findings(stdout: str) -> Any:
+    """Parse a JSON report, returning ``stdout`` unchanged if it is not JSON."""
+
+    try:
+        # orjson when installed: reports from bandit/semgrep can be megabytes.
+        return loads(stdout)
+    except JSONDecodeError:
+        pass
+    try:
+        # json also accepts the NaN and Infinity literals that orjson rejects.
+        return json.loads(stdout)
+    except json.JSONDecodeError:
+        return stdout
+
 
+def _scanner_env(targets: Sequence[str]) -> dict[str, str]:
     env = os.environ.copy()
     env.setdefault("CERTIFAI_TARGETS", " ".join(targets))
+    return env
+
+
+def run_scanner(
+    config: SecurityScannerConfig,
+    targets: Sequence[str],
+    *,
+    env: Mapping[str, str] | None = None,
+) -> ScannerInvocation:
+    """Run one scanner over ``targets``; ``env`` is a prepared environment shared across scanners."""
+
+    args = _prepare_command(config.command, targets)
+    LOGGER.debug("Running security scanner %s", config.name)
+
+    if env is None:
+        env = _scanner_env(targets)
 
     completed = subprocess.run(
         args,
@@ -52,10 +94,8 @@ def run_scanner(config: SecurityScannerConfig, targets: Sequence[str]) -> Scanne
     findings: Any = None
     stdout = completed.stdout.strip()
     if stdout:
-        try:
-            findings = json.loads(stdout)
-        except json.JSONDecodeError:
-            findings = stdout
+        # Plain-text reports are kept as-is without raising a decode error.
+        findings = _decode_findings(stdout) if stdout[0] in _JSON_START else stdout
 
     invocation = ScannerInvocation(
         name=config.name,
@@ -78,7 +118,15 @@ def run_all_scanners(settings: SecurityScannerSettings, paths: Iterable[Path | s
         return []
 
     targets = [str(Path(path)) for path in paths]
-    results: list[ScannerInvocation] = []
-    for scanner in settings.scanners:
-        results.append(run_scanner(scanner, targets))
-    return results
+    scanners = list(settings.scanners)
+    # Built once for all scanners; subprocess only reads it.
+    env = _scanner_env(targets)
+    # Scanners are independent subprocesses; threads only wait on them. Each
+    # scanner is CPU-bound itself, so running more at once than there are
+    # CPUs only makes them compete.
+    workers = min(len(scanners), os.cpu_count() or 1)
+    if workers == 1:
+        return [run_scanner(scanner, targets, env=env) for scanner in scanners]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="certifai-scanner") as executor:
+        futures = [executor.submit(run_scanner, scanner, targets, env=env) for scanner in scanners]
+        return [future.result() for future in futures]
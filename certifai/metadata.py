@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import ast
+import os
+import textwrap
+from dataclasses import replace
 from pathlib import Path
 from typing import Sequence, Tuple
 
-from .decorators import certifai, format_metadata_decorator
-from .models import CodeArtifact, TagMetadata
+from .decorators import certifai, format_metadata_decorator, is_metadata_decorator, metadata_from_decorator
+from .models import CodeArtifact, DecoratorBlock, TagMetadata
+from .parser import invalidate_parse_cache
 
 
 MetadataUpdate = Tuple[CodeArtifact, TagMetadata]
+# (first line index, end line index, replacement lines) of one splice.
+_Edit = Tuple[int, int, Sequence[str]]
 
-__all__ = ["MetadataUpdate", "update_metadata_blocks", "remove_metadata_blocks", "insert_metadata_block"]
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+__all__ = [
+    "MetadataUpdate",
+    "update_metadata_blocks",
+    "rewrite_metadata_blocks",
+    "remove_metadata_blocks",
+    "insert_metadata_block",
+]
 
 
 @certifai(
@@ -33,27 +49,84 @@ def update_metadata_blocks(path: Path, updates: Sequence[MetadataUpdate]) -> boo
     order of appearance to avoid shifting subsequent offsets.
     """
 
+    return rewrite_metadata_blocks(path, updates) is not None
+
+
+def rewrite_metadata_blocks(
+    path: Path,
+    updates: Sequence[MetadataUpdate],
+    artifacts: Sequence[CodeArtifact] = (),
+) -> list[CodeArtifact] | None:
+    """Apply ``updates`` like :func:`update_metadata_blocks` and relocate ``artifacts``.
+
+    Returns ``None`` when the file was left untouched. Otherwise returns
+    ``artifacts`` (taken from the file before the rewrite) as they appear
+    afterwards: line numbers shifted by the size change of every rewritten
+    block above them, and updated artifacts carrying their new decorator and
+    metadata. This spares callers a second full :func:`~certifai.parser.parse_file`.
+    """
+
     if not updates:
-        return False
+        return None
 
-    source = path.read_text(encoding="utf-8")
-    lines = source.splitlines()
-    changed = False
+    edits: list[_Edit] = []
+    # (old end line, line delta) of each rewritten block, and the new block
+    # lines keyed by the artifact they belong to.
+    shifts: list[tuple[int, int]] = []
+    rendered: dict[int, list[str]] = {}
 
-    for artifact, metadata in sorted(
-        updates, key=lambda item: item[0].start_line, reverse=True
-    ):
+    for artifact, metadata in updates:
         if artifact.decorator is None:
             continue
         decorator_lines = format_metadata_decorator(metadata, indent=artifact.indent)
         start_idx = artifact.decorator.start_line - 1
         end_idx = artifact.decorator.end_line
-        lines[start_idx:end_idx] = decorator_lines
-        changed = True
-
-    if changed:
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    return changed
+        edits.append((start_idx, end_idx, decorator_lines))
+        shifts.append((end_idx, len(decorator_lines) - (end_idx - start_idx)))
+        rendered[id(artifact)] = decorator_lines
+
+    if not edits:
+        return None
+    _splice_lines(path, edits)
+    return [_relocate(artifact, shifts, rendered.get(id(artifact))) for artifact in artifacts]
+
+
+def _relocate(
+    artifact: CodeArtifact,
+    shifts: Sequence[tuple[int, int]],
+    decorator_lines: list[str] | None,
+) -> CodeArtifact:
+    def shift(line: int) -> int:
+        return line + sum(delta for end_line, delta in shifts if end_line < line)
+
+    decorator = artifact.decorator
+    tags = artifact.tags
+    if decorator is not None:
+        start = shift(decorator.start_line)
+        if decorator_lines is None:
+            decorator = DecoratorBlock(start, shift(decorator.end_line), list(decorator.lines))
+        else:
+            decorator = DecoratorBlock(start, start + len(decorator_lines) - 1, list(decorator_lines))
+            tags = _metadata_from_lines(decorator_lines)
+    return replace(
+        artifact,
+        lineno=shift(artifact.lineno),
+        end_lineno=shift(artifact.end_lineno) if artifact.end_lineno is not None else None,
+        start_line=shift(artifact.start_line),
+        tags=tags,
+        decorator=decorator,
+    )
+
+
+def _metadata_from_lines(decorator_lines: Sequence[str]) -> TagMetadata:
+    """Read metadata back from freshly rendered decorator lines."""
+
+    snippet = textwrap.dedent("\n".join(decorator_lines)) + "\ndef _placeholder():\n    pass\n"
+    node = ast.parse(snippet).body[0]
+    for decorator in getattr(node, "decorator_list", []):
+        if is_metadata_decorator(decorator):
+            return metadata_from_decorator(decorator)
+    return TagMetadata()
 
 
 def remove_metadata_blocks(path: Path, artifacts: Sequence[CodeArtifact]) -> bool:
@@ -63,28 +136,15 @@ def remove_metadata_blocks(path: Path, artifacts: Sequence[CodeArtifact]) -> boo
     while retaining provenance data in the registry.
     """
 
-    if not artifacts:
+    edits: list[_Edit] = [
+        (artifact.decorator.start_line - 1, artifact.decorator.end_line, ())
+        for artifact in artifacts
+        if artifact.decorator is not None
+    ]
+    if not edits:
         return False
-
-    source = path.read_text(encoding="utf-8")
-    lines = source.splitlines()
-    changed = False
-
-    # Process in reverse order to avoid shifting subsequent offsets
-    for artifact in sorted(artifacts, key=lambda item: item.start_line, reverse=True):
-        decorator = artifact.decorator
-        if decorator is None:
-            continue
-
-        start_idx = decorator.start_line - 1
-        end_idx = decorator.end_line
-        del lines[start_idx:end_idx]
-        changed = True
-
-    if changed:
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-    return changed
+    _splice_lines(path, edits)
+    return True
 
 
 def insert_metadata_block(path: Path, artifact: CodeArtifact, metadata: TagMetadata) -> bool:
@@ -109,9 +169,54 @@ def insert_metadata_block(path: Path, artifact: CodeArtifact, metadata: TagMetad
     if not decorator_lines:
         return False
 
-    source = path.read_text(encoding="utf-8")
-    lines = source.splitlines()
     insertion_index = artifact.start_line - 1
-    lines[insertion_index:insertion_index] = decorator_lines
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _splice_lines(path, [(insertion_index, insertion_index, decorator_lines)])
     return True
+
+
+def _splice_lines(path: Path, edits: Sequence[_Edit]) -> None:
+    """Replace ``lines[start:end]`` with each edit's new lines in one read and write.
+
+    Edits index the file as it is before any of them, so they must not overlap;
+    applying them bottom-up keeps the earlier indices valid.
+    """
+
+    lines = _read_lines(path)
+    for start_idx, end_idx, new_lines in sorted(edits, key=lambda edit: edit[0], reverse=True):
+        lines[start_idx:end_idx] = [line.encode("utf-8") for line in new_lines]
+    _write_lines(path, lines)
+
+
+def _read_lines(path: Path) -> list[bytes]:
+    """Return the lines of ``path`` as UTF-8 bytes, without line endings.
+
+    Only rewritten decorator lines need encoding, so the file is never decoded
+    as a whole. ``bytes.splitlines`` also splits exactly where ``ast`` counts
+    lines, unlike ``str.splitlines`` which breaks on form feeds too.
+    """
+
+    # Raw descriptors skip the buffered/text wrapper setup (isatty, lseek)
+    # that ``Path.read_text`` pays on every file.
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size + 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 64 * 1024))
+    finally:
+        os.close(fd)
+    return b"".join(chunks).splitlines()
+
+
+def _write_lines(path: Path, lines: list[bytes]) -> None:
+    body = b"\n".join(lines)
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        # Gathering the trailing newline avoids copying the whole file to append it.
+        written = os.writev(fd, (body, b"\n")) if hasattr(os, "writev") else 0
+        rest = memoryview(body + b"\n")[written:] if written <= len(body) else b""
+        while rest:
+            rest = rest[os.write(fd, rest) :]
+    finally:
+        os.close(fd)
+    invalidate_parse_cache(path)
@@ -50,11 +50,18 @@ class ScrutinyLevel(str, Enum):
 
         if value is None:
             return None
-        normalized = value.strip().lower()
-        for candidate in cls:
-            if candidate.value == normalized:
-                return candidate
-        return None
+        return _SCRUTINY_BY_VALUE.get(value.strip().lower())
+
+    @property
+    def rank(self) -> int:
+        """Position from least (``AUTO``) to most (``HIGH``) thorough review."""
+
+        return _SCRUTINY_RANK[self]
+
+
+_SCRUTINY_BY_VALUE: dict[str, ScrutinyLevel] = {level.value: level for level in ScrutinyLevel}
+# Members are declared in increasing order of scrutiny.
+_SCRUTINY_RANK: dict[ScrutinyLevel, int] = {level: rank for rank, level in enumerate(ScrutinyLevel)}
 
 
 @certifai(
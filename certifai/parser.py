@@ -3,12 +3,33 @@
 from __future__ import annotations
 
 import ast
+import mmap
+import os
+import sys
+import time
 from pathlib import Path
 from typing import Iterable, Iterator, Sequence
 
-from .decorators import certifai, is_metadata_decorator, metadata_from_decorator
+from .decorators import PROVENANCE_DECORATOR_NAME, certifai, is_metadata_decorator, metadata_from_decorator
 from .models import CodeArtifact, DecoratorBlock, ScrutinyLevel, TagMetadata
 
+_ParseCacheKey = tuple[int, int, str]  # (st_dev, st_ino, path as given)
+_ParseCacheEntry = tuple[int, int, tuple[CodeArtifact, ...]]  # (st_mtime_ns, st_size, artifacts)
+
+_PARSE_CACHE: dict[_ParseCacheKey, _ParseCacheEntry] = {}
+_PARSE_CACHE_LIMIT = 4096
+# Files modified this recently are not cached: a second write within the same
+# filesystem timestamp tick could leave (mtime, size) unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+_DECORATOR_MARKER = PROVENANCE_DECORATOR_NAME.encode("ascii")
+# Decoded metadata by exact decorator source text. Boilerplate decorators repeat
+# verbatim across a codebase; entries are templates and are cloned on use.
+_METADATA_CACHE: dict[str, TagMetadata] = {}
+_METADATA_CACHE_LIMIT = 4096
+_BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+# Tool, VCS and build output directories never hold sources worth tracking.
+_PRUNED_DIRECTORIES = frozenset({".git", "__pycache__", ".venv", "node_modules", "build", "dist"})
+
 
 @certifai(
     ai_composed="gpt-5",
@@ -26,11 +47,29 @@ def iter_python_files(paths: Iterable[Path | str]) -> Iterator[Path]:
     for path in paths:
         candidate = Path(path).resolve()
         if candidate.is_dir():
-            yield from candidate.rglob("*.py")
+            yield from _walk_python_files(candidate)
         elif candidate.suffix == ".py":
             yield candidate
 
 
+def _walk_python_files(root: Path) -> Iterator[Path]:
+    # ``os.scandir`` reports entry types from the directory listing itself, so
+    # unlike ``Path.rglob`` no extra stat is needed per entry.
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _PRUNED_DIRECTORIES:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 @certifai(
     ai_composed="gpt-5",
     human_certified="PHZ",
@@ -44,10 +83,10 @@ def iter_python_files(paths: Iterable[Path | str]) -> Iterator[Path]:
 def _metadata_decorator_block(lines: list[str], node: ast.AST) -> tuple[TagMetadata, DecoratorBlock | None]:
     for decorator in getattr(node, "decorator_list", []):
         if is_metadata_decorator(decorator):
-            metadata = metadata_from_decorator(decorator)
             start_line = decorator.lineno
             end_line = getattr(decorator, "end_lineno", decorator.lineno)
             block_lines = lines[start_line - 1 : end_line]
+            metadata = _decoded_metadata(block_lines, decorator)
             return metadata, DecoratorBlock(
                 start_line=start_line,
                 end_line=end_line,
@@ -56,6 +95,19 @@ def _metadata_decorator_block(lines: list[str], node: ast.AST) -> tuple[TagMetad
     return TagMetadata(), None
 
 
+def _decoded_metadata(block_lines: list[str], decorator: ast.AST) -> TagMetadata:
+    # Identical source lines always decode to identical metadata, so the text
+    # itself is a safe key; the clone keeps callers free to mutate the result.
+    key = "\n".join(block_lines)
+    template = _METADATA_CACHE.get(key)
+    if template is None:
+        template = metadata_from_decorator(decorator)
+        if len(_METADATA_CACHE) >= _METADATA_CACHE_LIMIT:
+            _METADATA_CACHE.pop(next(iter(_METADATA_CACHE)), None)
+        _METADATA_CACHE[key] = template
+    return template.clone()
+
+
 @certifai(
     ai_composed="gpt-5",
     human_certified="pending",
@@ -145,7 +197,8 @@ class _ArtifactVisitor(ast.NodeVisitor):
     )
     def _visit_named_node(self, node: ast.AST, artifact_type: str) -> None:
         name = getattr(node, "name", "<anonymous>")
-        qualname = ".".join([*self._qualname_parts, name])
+        # Names key registry and lookup dicts; interning lets those compare by identity.
+        qualname = sys.intern(".".join([*self._qualname_parts, name]))
         start_line = self._artifact_start_line(node)
         metadata, decorator_block = _metadata_decorator_block(self._lines, node)
         end_lineno = getattr(node, "end_lineno", None)
@@ -180,6 +233,19 @@ class _ArtifactVisitor(ast.NodeVisitor):
             return min(decorator.lineno for decorator in decorators)
         return getattr(node, "lineno", 1)
 
+    def generic_visit(self, node: ast.AST) -> None:
+        # Definitions only ever appear in statement bodies, so expressions
+        # (which make up most of the tree) are never walked.
+        for field in _BODY_FIELDS:
+            children = getattr(node, field, None)
+            if not isinstance(children, list):
+                continue
+            for child in children:
+                if isinstance(child, ast.stmt):
+                    self.visit(child)
+                elif isinstance(child, (ast.excepthandler, ast.match_case)):
+                    self.generic_visit(child)
+
 
 @certifai(
     ai_composed="gpt-5",
@@ -209,8 +275,59 @@ def _indent_for_line(lines: list[str], line_number: int) -> str:
     ],
 )
 def parse_file(path: Path) -> Sequence[CodeArtifact]:
-    """Parse a Python file and extract provenance metadata."""
+    """Parse a Python file and extract provenance metadata.
+
+    Results are cached per file and reused while its size and modification
+    time are unchanged, so the returned artifacts must be treated as
+    read-only (use ``artifact.tags.clone()`` before mutating metadata).
+    """
+
+    stat = os.stat(path)
+    key = (stat.st_dev, stat.st_ino, os.fspath(path))
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return list(cached[2])
+
+    artifacts = _parse_source(path)
+    if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_LIMIT:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)), None)
+        _PARSE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, tuple(artifacts))
+    else:
+        _PARSE_CACHE.pop(key, None)
+    return artifacts
+
+
+def invalidate_parse_cache(path: Path | None = None) -> None:
+    """Drop cached :func:`parse_file` results for ``path`` (or for every file)."""
+
+    if path is None:
+        _PARSE_CACHE.clear()
+        return
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return
+    for key in [key for key in _PARSE_CACHE if key[0] == stat.st_dev and key[1] == stat.st_ino]:
+        _PARSE_CACHE.pop(key, None)
+
+
+def may_contain_metadata(path: Path) -> bool:
+    """Cheaply check whether ``path`` could hold any ``@certifai`` decorator.
+
+    Every spelling of the decorator contains its name, so a file without that
+    byte sequence has no metadata and needs no AST parse to prove it.
+    """
+
+    with open(path, "rb") as handle:
+        try:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped.find(_DECORATOR_MARKER) >= 0
+        except ValueError:  # empty file
+            return False
+
 
+def _parse_source(path: Path) -> list[CodeArtifact]:
     source = path.read_text(encoding="utf-8")
     lines = source.splitlines()
     tree = ast.parse(source, filename=str(path))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Sequence, Tuple, Iterable, Mapping
+from typing import Any, Dict, Sequence, Tuple, Iterable, Mapping
 
 import yaml
 
@@ -81,6 +84,7 @@ class SecurityScannerConfig:
 class SecurityScannerSettings:
     enabled: bool = False
     scanners: Tuple[SecurityScannerConfig, ...] = ()
+    max_output_chars: int = 65536
 
 
 @dataclass(slots=True)
@@ -128,6 +132,8 @@ class AuditSettings:
     enabled: bool = False
     log_path: str | None = None
     dashboard_url: str | None = None
+    fsync: bool = False
+    rotate_mb: int = 16
 
 
 # @ai_composed: gpt-5
@@ -154,6 +160,19 @@ class AgentPermission:
 class AgentSettings:
     enabled: bool = False
     reviewers: Tuple[AgentPermission, ...] = ()
+    _index: Dict[str, AgentPermission] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed: Tuple[AgentPermission, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def permission_for(self, agent_id: str) -> AgentPermission | None:
+        """Return the first permission entry for ``agent_id``, if any."""
+
+        if self._indexed is not self.reviewers:
+            index: Dict[str, AgentPermission] = {}
+            for permission in self.reviewers:
+                index.setdefault(permission.id, permission)
+            self._index = index
+            self._indexed = self.reviewers
+        return self._index.get(agent_id)
 
 
 # @ai_composed: gpt-5
@@ -197,6 +216,15 @@ DEFAULT_POLICY = PolicyConfig(
     integrations=IntegrationsConfig(),
 )
 
+# libyaml's loader is several times faster when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Least recently used first; a process rarely sees more than a couple of policy files.
+_POLICY_CACHE: "OrderedDict[str, tuple[int, int, PolicyConfig]]" = OrderedDict()
+_POLICY_CACHE_SIZE = 16
+# Files modified this recently are not cached: a second write within the same
+# filesystem timestamp tick could leave (mtime, size) unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 @certifai(
     ai_composed="gpt-5",
@@ -212,11 +240,33 @@ def load_policy(path: Path | None = None) -> PolicyConfig:
     """Load the certifai policy configuration from disk."""
 
     config_path = _resolve_config_path(path)
-    if config_path is None or not config_path.exists():
+    if config_path is None:
+        return DEFAULT_POLICY
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
         return DEFAULT_POLICY
 
+    # Like DEFAULT_POLICY, cached policies are shared and must not be mutated.
+    key = os.path.abspath(config_path)
+    cached = _POLICY_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _POLICY_CACHE.move_to_end(key)
+        return cached[2]
+    policy = _load_policy_file(config_path)
+    if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+        _POLICY_CACHE[key] = (stat.st_mtime_ns, stat.st_size, policy)
+        _POLICY_CACHE.move_to_end(key)
+        if len(_POLICY_CACHE) > _POLICY_CACHE_SIZE:
+            _POLICY_CACHE.popitem(last=False)
+    else:
+        _POLICY_CACHE.pop(key, None)
+    return policy
+
+
+def _load_policy_file(config_path: Path) -> PolicyConfig:
     with config_path.open(encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = yaml.load(handle, Loader=_YAML_LOADER) or {}
 
     enforcement = _parse_enforcement(raw.get("enforcement", {}))
     reviewers = tuple(raw.get("reviewers", []) or [])
@@ -303,6 +353,7 @@ def _parse_integrations(data: Any) -> IntegrationsConfig:
     security = SecurityScannerSettings(
         enabled=bool(security_data.get("enabled", bool(scanner_items))),
         scanners=tuple(scanner_items),
+        max_output_chars=int(security_data.get("max_output_chars", 65536)),
     )
 
     publishing_data = data.get("publishing", {})
@@ -345,6 +396,8 @@ def _parse_integrations(data: Any) -> IntegrationsConfig:
         enabled=bool(audit_data.get("enabled", False)),
         log_path=audit_data.get("log_path"),
         dashboard_url=audit_data.get("dashboard_url"),
+        fsync=bool(audit_data.get("fsync", False)),
+        rotate_mb=int(audit_data.get("rotate_mb", 16)),
     )
 
     agents_data = data.get("agents", {})
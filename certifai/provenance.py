@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 from .decorators import certifai, format_metadata_decorator
-from .history import build_history_entry, compute_digest, extract_digest
+from .history import build_history_entries, compute_digest, extract_digest
 from .metadata import MetadataUpdate, update_metadata_blocks
 from .models import CodeArtifact, ScrutinyLevel, TagMetadata
-from .parser import iter_python_files, parse_file
+from .parser import invalidate_parse_cache, iter_python_files, parse_file
 from .policy import DEFAULT_POLICY, PolicyConfig
 from .utils.logging import get_logger
 
@@ -97,6 +97,37 @@ def annotate_paths(
     )
 
 
+def certification_check(policy: PolicyConfig) -> Callable[[CodeArtifact], bool]:
+    """Return a predicate telling whether an artifact counts as certified under ``policy``.
+
+    An artifact counts when a human signed it off, or when a permitted agent
+    reviewed it at no more than that agent's ``max_scrutiny``. Each agent's
+    limit is resolved once here rather than per reviewer entry.
+    """
+
+    # Agent id -> highest scrutiny rank it may certify, or None for no limit.
+    agent_limits: dict[str, int | None] = {}
+    for perm in policy.integrations.agents.reviewers:
+        max_level = ScrutinyLevel.from_string(perm.max_scrutiny) if perm.max_scrutiny else None
+        agent_limits[perm.id] = max_level.rank if max_level is not None else None
+
+    def is_certified(artifact: CodeArtifact) -> bool:
+        tags = artifact.tags
+        if tags.human_certified and tags.human_certified.lower() != "pending":
+            return True
+        for reviewer in tags.reviewers:
+            if reviewer.kind == "human":
+                if reviewer.id and reviewer.id.lower() != "pending":
+                    return True
+            elif reviewer.kind == "agent" and reviewer.id in agent_limits:
+                limit = agent_limits[reviewer.id]
+                if limit is None or (reviewer.scrutiny or ScrutinyLevel.AUTO).rank <= limit:
+                    return True
+        return False
+
+    return is_certified
+
+
 @certifai(
     ai_composed="gpt-5",
     human_certified="PHZ",
@@ -128,26 +159,8 @@ def enforce_policy(artifacts: Sequence[CodeArtifact], policy: PolicyConfig) -> l
         ]
         total = len(function_artifacts)
         if total:
-            allowed_agents = {perm.id: perm for perm in policy.integrations.agents.reviewers}
-
-            def _is_certified(artifact: CodeArtifact) -> bool:
-                if artifact.tags.human_certified and artifact.tags.human_certified.lower() != "pending":
-                    return True
-                for reviewer in artifact.tags.reviewers:
-                    if reviewer.kind == "human" and reviewer.id and reviewer.id.lower() != "pending":
-                        return True
-                    if reviewer.kind == "agent" and reviewer.id in allowed_agents:
-                        perm = allowed_agents[reviewer.id]
-                        max_level = ScrutinyLevel.from_string(perm.max_scrutiny) if perm.max_scrutiny else None
-                        if max_level is None:
-                            return True
-                        agent_level = reviewer.scrutiny or ScrutinyLevel.AUTO
-                        order = [ScrutinyLevel.AUTO, ScrutinyLevel.LOW, ScrutinyLevel.MEDIUM, ScrutinyLevel.HIGH]
-                        if order.index(agent_level) <= order.index(max_level):
-                            return True
-                return False
-
-            certified = sum(1 for artifact in function_artifacts if _is_certified(artifact))
+            is_certified = certification_check(policy)
+            certified = sum(1 for artifact in function_artifacts if is_certified(artifact))
             coverage = certified / total
             if coverage < policy.enforcement.min_coverage:
                 violations.append(
@@ -185,22 +198,23 @@ def _ensure_metadata_decorators(
     iso_timestamp = effective_timestamp.isoformat()
     changed = False
 
-    for artifact in sorted(artifacts, key=lambda item: item.start_line, reverse=True):
-        metadata = TagMetadata(
-            ai_composed=ai_agent,
-            human_certified="pending",
-            scrutiny=ScrutinyLevel.AUTO,
-            date=iso_timestamp,
-            notes=default_notes,
+    updates: list[MetadataUpdate] = [
+        (
+            artifact,
+            TagMetadata(
+                ai_composed=ai_agent,
+                human_certified="pending",
+                scrutiny=ScrutinyLevel.AUTO,
+                date=iso_timestamp,
+                notes=default_notes,
+            ),
         )
-        metadata.history = [
-            build_history_entry(
-                artifact,
-                metadata,
-                timestamp=effective_timestamp,
-                action="annotated",
-            )
-        ]
+        for artifact in sorted(artifacts, key=lambda item: item.start_line, reverse=True)
+    ]
+    # One blame per file rather than one per inserted decorator.
+    entries = build_history_entries(updates, timestamp=effective_timestamp, action="annotated")
+    for (artifact, metadata), entry in zip(updates, entries):
+        metadata.history = [entry]
 
         decorator_lines = format_metadata_decorator(metadata, indent=artifact.indent)
         if not decorator_lines:
@@ -211,6 +225,7 @@ def _ensure_metadata_decorators(
 
     if changed:
         path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        invalidate_parse_cache(path)
     return changed
 
 
@@ -236,24 +251,17 @@ def _refresh_history_blocks(
         if artifact.decorator is None:
             continue
 
-        metadata = artifact.tags.clone()
-        existing_entry = metadata.history[0] if metadata.history else None
-        current_digest = compute_digest(metadata)
-        stored_digest = extract_digest(existing_entry)
-
-        if stored_digest == current_digest and existing_entry is not None:
+        tags = artifact.tags
+        existing_entry = tags.history[0] if tags.history else None
+        if existing_entry is not None and extract_digest(existing_entry) == compute_digest(tags):
             continue
-
-        metadata.history = [
-            build_history_entry(
-                artifact,
-                metadata,
-                timestamp=effective_timestamp,
-            )
-        ]
-        updates.append((artifact, metadata))
+        # Only the history is replaced, so a shallow copy is enough.
+        updates.append((artifact, replace(tags)))
 
     if not updates:
         return False
 
+    entries = build_history_entries(updates, timestamp=effective_timestamp)
+    for (_artifact, metadata), entry in zip(updates, entries):
+        metadata.history = [entry]
     return update_metadata_blocks(path, updates)
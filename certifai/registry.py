@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +14,7 @@ from .models import CodeArtifact, TagMetadata
 
 _REGISTRY_DIR = Path(".certifai")
 _REGISTRY_FILE = "registry.yml"
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass(slots=True)
@@ -123,13 +125,14 @@ def load_registry(root: Path | None = None) -> RegistryStore:
     if not path.exists():
         return RegistryStore()
     with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = yaml.load(handle, Loader=_YAML_LOADER) or {}
     history = raw.get("history", []) or []
     store = RegistryStore(history=history)
     for item in raw.get("artifacts", []):
         entry = RegistryEntry(
-            filepath=item["filepath"],
-            qualified_name=item["qualified_name"],
+            # Paths repeat for every artifact in a file; share one string per key part.
+            filepath=sys.intern(item["filepath"]),
+            qualified_name=sys.intern(item["qualified_name"]),
             digest=item["digest"],
             human_certified=item.get("human_certified", ""),
             scrutiny=item.get("scrutiny"),
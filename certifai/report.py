@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import Any, Iterable, Mapping, Sequence, TextIO
 
 from .decorators import certifai
 from .models import CodeArtifact, ScrutinyLevel
 from .parser import iter_python_files, parse_file
+from .utils.cache import CACHE_DIR, ensure_cache_dir
+from .utils.logging import get_logger
+from .utils.serialization import JSONDecodeError, dumps_bytes, loads
+
+LOGGER = get_logger("report")
+
+_SUMMARY_COUNT_FIELDS = (
+    "total_functions",
+    "ai_composed",
+    "human_certified",
+    "pending_review",
+    "agent_certified",
+    "scrutiny_counts",
+)
+# Files modified this recently are not cached: a second write within the same
+# filesystem timestamp tick could leave (mtime, size) unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
 
 
 @certifai(
@@ -137,6 +157,108 @@ def build_summary(paths: Iterable[Path | str]) -> CoverageSummary:
     )
 
 
+def build_summary_cached(paths: Iterable[Path | str], *, cache_dir: Path | None = None) -> CoverageSummary:
+    """Build a coverage summary, reusing the counts of an earlier identical scan.
+
+    The cache key hashes the path, ``mtime_ns`` and size of every scanned file,
+    so an unchanged tree costs one ``stat`` per file instead of a parse. A
+    summary served from the cache carries counts only: its ``artifacts`` are
+    empty.
+    """
+
+    files, cache_path, cacheable = _summary_cache_entry(paths, cache_dir)
+    cached = _load_cached_summary(cache_path)
+    if cached is not None:
+        return cached
+
+    summary = build_summary(files)
+    if cacheable:
+        _store_cached_summary(cache_path, summary)
+    return summary
+
+
+def compute_coverage_ratio(paths: Iterable[Path | str], *, cache_dir: Path | None = None) -> float:
+    """Return the ``coverage_ratio`` of :func:`build_summary` for ``paths``.
+
+    Only two counters are kept, so no artifact list or scrutiny breakdown is
+    built. A summary cached by :func:`build_summary_cached` for the same scan
+    is used when available.
+    """
+
+    files, cache_path, _cacheable = _summary_cache_entry(paths, cache_dir)
+    cached = _load_cached_summary(cache_path)
+    if cached is not None:
+        return cached.coverage_ratio
+
+    total = 0
+    certified = 0
+    for path in files:
+        for artifact in parse_file(path):
+            if artifact.artifact_type not in {"function", "async_function"}:
+                continue
+            total += 1
+            tags = artifact.tags
+            if (
+                not tags.is_pending_certification
+                and tags.human_certified
+                and tags.human_certified.lower() != "pending"
+            ):
+                certified += 1
+    return certified / total if total else 0.0
+
+
+def _summary_cache_entry(paths: Iterable[Path | str], cache_dir: Path | None) -> tuple[list[Path], Path, bool]:
+    """Return the scanned files, their summary cache path and whether it may be written."""
+
+    files = sorted(set(iter_python_files(paths)))
+    hasher = hashlib.blake2b(digest_size=16)
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    cacheable = True
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            cacheable = False
+            continue
+        cacheable = cacheable and stat.st_mtime_ns < racy_after
+        hasher.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+
+    directory = (Path.cwd() / CACHE_DIR) if cache_dir is None else cache_dir
+    return files, directory / f"summary-{hasher.hexdigest()}.json", cacheable
+
+
+def _emit(text: str, file: TextIO | None) -> str:
+    if file is not None:
+        file.write(text + "\n")
+    return text
+
+
+def _load_cached_summary(path: Path) -> CoverageSummary | None:
+    try:
+        raw: Any = loads(path.read_bytes())
+    except (OSError, JSONDecodeError):
+        return None
+    if not isinstance(raw, dict) or any(field not in raw for field in _SUMMARY_COUNT_FIELDS):
+        return None
+    return CoverageSummary(artifacts=(), **{field: raw[field] for field in _SUMMARY_COUNT_FIELDS})
+
+
+def _store_cached_summary(path: Path, summary: CoverageSummary) -> None:
+    payload = {field: getattr(summary, field) for field in _SUMMARY_COUNT_FIELDS}
+    temporary = path.with_name(path.name + ".tmp")
+    try:
+        ensure_cache_dir(path.parent)
+        temporary.write_bytes(dumps_bytes(payload))
+        os.replace(temporary, path)
+        # Only the latest scan is worth keeping; older keys can never match again
+        # unless files are reverted, and the tree would otherwise grow unbounded.
+        for stale in path.parent.glob("summary-*.json"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        LOGGER.debug("Could not write summary cache %s: %s", path, exc)
+
+
 @certifai(
     ai_composed="gpt-5",
     human_certified="PHZ",
@@ -147,8 +269,11 @@ def build_summary(paths: Iterable[Path | str]) -> CoverageSummary:
         "2025-11-08T01:22:48.033040+00:00 digest=1c7f183374fb0c2b076a530fd9c040c5ab5703f5 last_commit=f07d0d9 by phzwart",
     ],
 )
-def emit_text_report(summary: CoverageSummary) -> str:
-    """Render a human-readable report for console output."""
+def emit_text_report(summary: CoverageSummary, file: TextIO | None = None) -> str:
+    """Render a human-readable report for console output.
+
+    When ``file`` is given the report is also written to it, newline-terminated.
+    """
 
     coverage_percent = summary.coverage_ratio * 100
     scrutiny_parts = ", ".join(
@@ -163,7 +288,7 @@ def emit_text_report(summary: CoverageSummary) -> str:
         f"Scrutiny levels — {scrutiny_parts}",
         f"Certification coverage: {coverage_percent:.1f}%",
     ]
-    return "\n".join(lines)
+    return _emit("\n".join(lines), file)
 
 
 @certifai(
@@ -176,8 +301,11 @@ def emit_text_report(summary: CoverageSummary) -> str:
         "2025-11-08T01:22:48.033040+00:00 digest=1c7f183374fb0c2b076a530fd9c040c5ab5703f5 last_commit=f07d0d9 by phzwart",
     ],
 )
-def emit_csv_report(summary: CoverageSummary) -> str:
-    """Return a CSV representation of the coverage metrics."""
+def emit_csv_report(summary: CoverageSummary, file: TextIO | None = None) -> str:
+    """Return a CSV representation of the coverage metrics.
+
+    When ``file`` is given the CSV is also written to it, newline-terminated.
+    """
 
     headers = [
         "total_functions",
@@ -196,7 +324,7 @@ def emit_csv_report(summary: CoverageSummary) -> str:
         f"{summary.coverage_ratio:.4f}",
     ]
     csv_lines = [",".join(headers), ",".join(row)]
-    return "\n".join(csv_lines)
+    return _emit("\n".join(csv_lines), file)
 
 
 @certifai(
@@ -209,8 +337,11 @@ def emit_csv_report(summary: CoverageSummary) -> str:
         "2025-11-08T01:22:48.033040+00:00 digest=1c7f183374fb0c2b076a530fd9c040c5ab5703f5 last_commit=f07d0d9 by phzwart",
     ],
 )
-def emit_markdown_table(summary: CoverageSummary) -> str:
-    """Return a markdown table summarising coverage metrics."""
+def emit_markdown_table(summary: CoverageSummary, file: TextIO | None = None) -> str:
+    """Return a markdown table summarising coverage metrics.
+
+    When ``file`` is given the table is also written to it, newline-terminated.
+    """
 
     header = "| Metric | Value |\n| --- | --- |"
     rows = [
@@ -221,7 +352,7 @@ def emit_markdown_table(summary: CoverageSummary) -> str:
         f"| Pending review | {summary.pending_review} |",
         f"| Coverage | {summary.coverage_ratio * 100:.1f}% |",
     ]
-    return "\n".join([header, *rows])
+    return _emit("\n".join([header, *rows]), file)
 
 
 @certifai(
@@ -0,0 +1,24 @@
+"""Helpers for certifai's local, never-committed cache directory."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+CACHE_DIR = Path(".certifai") / "cache"
+"""Cache location relative to the project root; ``.certifai/registry.yml`` beside it is committed."""
+
+
+def ensure_cache_dir(directory: Path) -> None:
+    """Create ``directory`` with a ``.gitignore`` that keeps its contents out of git.
+
+    The ignore rule ships with the cache itself, so projects that commit
+    ``.certifai/`` never pick up cache files by accident.
+    """
+
+    directory.mkdir(parents=True, exist_ok=True)
+    ignore = directory / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("# Local certifai caches; safe to delete.\n*\n", encoding="utf-8")
+
+
+__all__ = ["CACHE_DIR", "ensure_cache_dir"]
@@ -6,7 +6,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from git import Repo
+from git import Commit, Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 from certifai.decorators import certifai
@@ -21,15 +21,33 @@ from certifai.decorators import certifai
         "2025-11-08T01:24:35.335455+00:00 digest=98d5bcde7c7e9d363c1723dcc08ac137b85262a6 last_commit=f07d0d9 by phzwart",
     ],
 )
-@lru_cache(maxsize=1)
 def get_repo(start_path: Path | None = None) -> Optional[Repo]:
     """Return a GitPython Repo rooted at or above the provided path."""
 
     search_path = start_path or Path.cwd()
+    directory = search_path if search_path.is_dir() else search_path.parent
+    root = _repo_root(directory)
+    return None if root is None else _repo_at_root(root)
+
+
+@lru_cache(maxsize=1024)
+def _repo_root(directory: Path) -> Optional[str]:
+    """Return the root of the repository containing ``directory``, if any."""
+
     try:
-        return Repo(search_path, search_parent_directories=True)
+        probe = Repo(directory, search_parent_directories=True)
     except InvalidGitRepositoryError:
         return None
+    # Only discovery is needed; close so no git helper process outlives it.
+    probe.close()
+    return probe.working_tree_dir or probe.git_dir
+
+
+@lru_cache(maxsize=None)
+def _repo_at_root(root: str) -> Repo:
+    # One Repo, and so one persistent ``git cat-file`` helper, per repository
+    # however many directories are looked up in it.
+    return Repo(root)
 
 
 @certifai(
@@ -45,6 +63,20 @@ def get_repo(start_path: Path | None = None) -> Optional[Repo]:
 def describe_line(path: Path, lineno: int) -> dict[str, str] | None:
     """Return commit metadata for a specific line within a file."""
 
+    commits = blame_commits(path)
+    if commits is None or not 1 <= lineno <= len(commits):
+        return None
+    return commit_info(commits[lineno - 1])
+
+
+def blame_commits(path: Path) -> list[Commit] | None:
+    """Return the commit that last touched each line of ``path`` at ``HEAD``.
+
+    Index ``lineno - 1`` holds the commit for line ``lineno``; ``None`` means
+    the file is outside a repository or not tracked. One blame serves any
+    number of line lookups in the same file.
+    """
+
     repo = get_repo(path)
     if repo is None:
         return None
@@ -56,16 +88,16 @@ def describe_line(path: Path, lineno: int) -> dict[str, str] | None:
         blame_entries = repo.blame("HEAD", str(relpath))
     except GitCommandError:
         return None
-    current_line = 0
+    commits: list[Commit] = []
     for commit, lines in blame_entries:
-        for _ in lines:
-            current_line += 1
-            if current_line == lineno:
-                committed_datetime = commit.committed_datetime.isoformat()
-                return {
-                    "commit": commit.hexsha,
-                    "author": commit.author.name,
-                    "email": commit.author.email,
-                    "timestamp": committed_datetime,
-                }
-    return None
+        commits.extend([commit] * len(lines))
+    return commits
+
+
+def commit_info(commit: Commit) -> dict[str, str]:
+    return {
+        "commit": commit.hexsha,
+        "author": commit.author.name,
+        "email": commit.author.email,
+        "timestamp": commit.committed_datetime.isoformat(),
+    }
@@ -0,0 +1,31 @@
+"""Process-pool helpers for independent per-file work."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+MIN_PARALLEL_ITEMS = 4
+"""Below this many items the work runs in-process; spawning workers costs more."""
+
+
+def parallel_map(func: Callable[[_T], _R], items: Sequence[_T], *, chunksize: int = 8) -> list[_R]:
+    """Apply ``func`` to every item, fanning out across processes for larger batches.
+
+    ``func`` must be a picklable module-level callable (``functools.partial`` of
+    one is fine) and results are returned in input order. Items must be
+    independent of each other, e.g. distinct source files.
+    """
+
+    workers = min(os.cpu_count() or 1, len(items))
+    if len(items) < MIN_PARALLEL_ITEMS or workers < 2:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=max(1, min(chunksize, len(items) // workers))))
+
+
+__all__ = ["MIN_PARALLEL_ITEMS", "parallel_map"]
@@ -0,0 +1,61 @@
+"""JSON encoding helpers that prefer ``orjson`` when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:  # pragma: no cover - exercised implicitly depending on the environment
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+JSONDecodeError = json.JSONDecodeError
+"""Raised by :func:`loads`; ``orjson.JSONDecodeError`` subclasses it."""
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize ``value`` to compact UTF-8 encoded JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode("utf-8")
+
+
+def dumps_line(value: Any) -> bytes:
+    """Serialize ``value`` like :func:`dumps_bytes` with a trailing newline."""
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(value).encode("utf-8") + b"\n"
+
+
+def dumps_indented(
+    value: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    sort_keys: bool = False,
+) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON indented by two spaces.
+
+    ``default`` converts objects the encoder does not support and
+    ``sort_keys`` orders every object's keys, as with :func:`json.dumps`.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=default, option=option)
+    return json.dumps(value, indent=2, default=default, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document from ``bytes`` or ``str``."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["JSONDecodeError", "dumps_bytes", "dumps_indented", "dumps_line", "loads"]
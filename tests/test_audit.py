@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 
@@ -156,3 +159,401 @@ integrations:
     assert latest["data"]["result"] == "issues_found"
 
     assert audit.has_blocking_issues(artifact_id, min_severity="medium")
+
+
+def test_concurrent_writes_keep_lines_intact(tmp_path: Path) -> None:
+    import threading
+
+    from certifai.audit import AuditRecord, _write_records
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "nested" / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path), fsync=True)
+
+    def _worker(index: int) -> None:
+        records = [
+            AuditRecord(timestamp="t", action="enforce", data={"worker": index, "seq": seq})
+            for seq in range(25)
+        ]
+        _write_records(settings, records)
+
+    threads = [threading.Thread(target=_worker, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 200
+    seen = {(entry["data"]["worker"], entry["data"]["seq"]) for entry in map(json.loads, lines)}
+    assert len(seen) == 200
+
+
+def test_writer_reopens_log_after_unlink(tmp_path: Path) -> None:
+    from certifai.audit import AuditRecord, _write_records
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    record = AuditRecord(timestamp="t", action="enforce", data={})
+
+    _write_records(settings, [record])
+    log_path.unlink()
+    _write_records(settings, [record])
+
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_read_audit_log_limit_reads_tail(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from certifai import audit as audit_module
+    from certifai.audit import AuditRecord, _write_records, read_audit_log
+    from certifai.policy import AuditSettings
+
+    # Small blocks force the reverse reader across several block boundaries.
+    monkeypatch.setattr(audit_module, "_TAIL_BLOCK_SIZE", 16)
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    _write_records(
+        settings,
+        [AuditRecord(timestamp="t", action="enforce", data={"seq": seq}) for seq in range(50)],
+    )
+    with log_path.open("ab") as handle:
+        handle.write(b"not json\n\n")
+
+    entries = read_audit_log(settings, limit=4)
+    assert [entry["data"]["seq"] for entry in entries] == [47, 48, 49]
+    assert read_audit_log(settings, limit=0) == []
+    assert len(read_audit_log(settings)) == 50
+
+
+def test_findings_index_tracks_appends_and_since_cutoff(tmp_path: Path) -> None:
+    from certifai.audit import AuditRecord, _write_records
+    from certifai.audit_index import index_path
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    audit = Audit(settings)
+
+    def _review(timestamp: str, artifact: str, severity: str) -> AuditRecord:
+        return AuditRecord(
+            timestamp=timestamp,
+            action="agent_review",
+            data={"artifact": artifact, "findings": [{"severity": severity, "message": artifact}]},
+        )
+
+    _write_records(
+        settings,
+        [
+            _review("2001-01-01T00:00:00+00:00", "old", "high"),
+            AuditRecord(timestamp="2001-01-02T00:00:00+00:00", action="enforce", data={}),
+        ],
+    )
+    assert audit.get_findings(since_days=-1)[0]["artifact"] == "old"
+    assert audit.get_findings() == []
+    # A 24-byte header naming the log, then one 24-byte record per line.
+    assert index_path(log_path).stat().st_size == 3 * 24
+
+    audit.record_review("agent", "new", "new.py", "issues_found", findings=[{"severity": "low", "message": "x"}])
+    # Out-of-order timestamps must not hide later entries from the cutoff search.
+    _write_records(settings, [_review("2000-01-01T00:00:00+00:00", "older", "high")])
+
+    assert [item["artifact"] for item in audit.get_findings()] == ["new"]
+    assert [item["artifact"] for item in audit.get_findings(since_days=-1, severity="high")] == ["old", "older"]
+    assert audit.get_latest_review("new")["data"]["artifact"] == "new"
+    assert audit.get_latest_review("missing") is None
+
+    # Replacing the log invalidates the stale index.
+    log_path.unlink()
+    _write_records(settings, [_review("2001-01-01T00:00:00+00:00", "fresh", "high")])
+    assert [item["artifact"] for item in audit.get_findings(since_days=-1)] == ["fresh"]
+
+
+def test_summarize_findings_counts_known_severities() -> None:
+    from certifai.audit import _summarize_findings
+
+    findings = [{"severity": "HIGH"}, {"severity": "high"}, {}, {"severity": "bogus"}]
+    assert _summarize_findings(findings) == {"total_issues": 4, "high": 2, "info": 1}
+    assert _summarize_findings([]) == {}
+
+
+def test_record_review_stores_severity_codes(tmp_path: Path) -> None:
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    audit = Audit(AuditSettings(enabled=True, log_path=str(log_path)))
+    audit.record_review(
+        "agent", "mod::fn", "mod.py", "issues_found",
+        findings=[{"severity": "Critical", "message": "boom"}, {"severity": "low", "message": "nit"}],
+    )
+
+    stored = json.loads(log_path.read_text(encoding="utf-8"))
+    assert stored["data"]["severity_codes"] == [4, 1]
+    assert stored["data"]["findings"] == [{"severity": "Critical", "message": "boom"}, {"severity": "low", "message": "nit"}]
+    assert stored["ts"] == int(datetime.fromisoformat(stored["timestamp"]).timestamp())
+    assert audit.has_blocking_issues("mod::fn", min_severity="critical")
+    assert [item["finding"] for item in audit.get_findings(severity="high")] == [{"severity": "Critical", "message": "boom"}]
+    assert "_sev" not in audit.get_latest_review("mod::fn")["data"]["findings"][0]
+
+
+def test_iter_audit_log_streams_entries(tmp_path: Path) -> None:
+    from certifai.audit import AuditRecord, _write_records, iter_audit_log
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    assert list(iter_audit_log(settings)) == []
+
+    _write_records(settings, [AuditRecord(timestamp="t", action="enforce", data={"seq": seq}) for seq in range(3)])
+    entries = iter_audit_log(settings)
+    assert next(entries)["data"] == {"seq": 0}
+    assert [entry["data"]["seq"] for entry in entries] == [1, 2]
+
+
+def test_batch_of_records_is_appended_with_one_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import os
+
+    from certifai.audit import record_finalization
+    from certifai.models import CodeArtifact, TagMetadata
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    artifacts = [
+        CodeArtifact(
+            name=f"fn{index}",
+            artifact_type="function",
+            filepath=tmp_path / "mod.py",
+            lineno=index + 1,
+            end_lineno=index + 1,
+            start_line=index + 1,
+            tags=TagMetadata(ai_composed="gpt-5", human_certified="Alice"),
+            indent="",
+            decorator=None,
+        )
+        for index in range(5)
+    ]
+
+    writes: list[int] = []
+    real_write = os.write
+
+    def _counting_write(fd: int, data: bytes) -> int:
+        writes.append(fd)
+        return real_write(fd, data)
+
+    monkeypatch.setattr(os, "write", _counting_write)
+    record_finalization(settings, artifacts)
+
+    assert len(writes) == 1
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_audit_record_is_frozen_and_encodes_itself() -> None:
+    import dataclasses
+
+    from certifai.audit import AuditRecord
+
+    record = AuditRecord(timestamp="2001-01-01T00:00:00+00:00", action="enforce", data={"status": "ok"})
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.action = "certify"  # type: ignore[misc]
+    assert json.loads(record.to_json_bytes()) == {
+        "timestamp": "2001-01-01T00:00:00+00:00",
+        "ts": 978307200,
+        "action": "enforce",
+        "data": {"status": "ok"},
+    }
+
+
+def test_latest_review_map_follows_appends_and_replacement(tmp_path: Path) -> None:
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    audit = Audit(AuditSettings(enabled=True, log_path=str(log_path)))
+    assert audit.get_latest_review("a") is None
+
+    audit.record_review("agent", "a", "a.py", "clean")
+    audit.record_review("agent", "b", "b.py", "clean")
+    assert audit.get_latest_review("a")["data"]["result"] == "clean"
+
+    audit.record_review("agent", "a", "a.py", "issues_found")
+    assert audit.get_latest_review("a")["data"]["result"] == "issues_found"
+    assert audit.get_latest_review("b")["data"]["artifact"] == "b"
+
+    log_path.unlink()
+    audit.record_review("agent", "c", "c.py", "error", padding="x" * 1024)
+    assert audit.get_latest_review("a") is None
+    assert audit.get_latest_review("c")["data"]["result"] == "error"
+
+
+def test_log_rotates_into_compressed_segments(tmp_path: Path) -> None:
+    from certifai.audit import _wait_for_compressions, iter_audit_log, read_audit_log
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path), rotate_mb=1)
+    audit = Audit(settings)
+    padding = "x" * (600 * 1024)
+
+    audit.record_review("agent", "a", "a.py", "issues_found", findings=[{"severity": "high", "message": "old"}], padding=padding)
+    audit.record_review("agent", "b", "b.py", "clean", padding=padding)
+    audit.record_review("agent", "c", "c.py", "clean")
+    _wait_for_compressions()
+
+    segments = sorted(path.name for path in tmp_path.iterdir() if path.name.startswith("audit.log.0"))
+    assert len(segments) == 1 and segments[0].startswith("audit.log.000001.")
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+
+    assert [entry["data"]["artifact"] for entry in iter_audit_log(settings)] == ["a", "b", "c"]
+    assert [entry["data"]["artifact"] for entry in read_audit_log(settings)] == ["a", "b", "c"]
+    assert [entry["data"]["artifact"] for entry in read_audit_log(settings, limit=2)] == ["b", "c"]
+    assert [item["artifact"] for item in audit.get_findings()] == ["a"]
+    assert audit.get_latest_review("a")["data"]["result"] == "issues_found"
+    assert audit.has_blocking_issues("a")
+
+
+def test_segment_compression_keeps_plain_segment_when_unsafe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from certifai import audit as audit_module
+
+    monkeypatch.setattr(audit_module, "zstandard", None)
+    grown = tmp_path / "audit.log.000001"
+    grown.write_bytes(b'{"n": 1}\n')
+    real_copy = audit_module.shutil.copyfileobj
+
+    def copy_then_append(*args: Any) -> None:
+        real_copy(*args)
+        # A writer still holding the pre-rotation descriptor appends mid-compression.
+        with grown.open("ab") as late_writer:
+            late_writer.write(b'{"n": 2}\n')
+
+    monkeypatch.setattr(audit_module.shutil, "copyfileobj", copy_then_append)
+    audit_module._compress_segment(grown)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["audit.log.000001"]
+
+    broken = tmp_path / "audit.log.000002"
+    broken.write_bytes(b'{"n": 3}\n')
+    monkeypatch.setattr(audit_module.shutil, "copyfileobj", Mock(side_effect=OSError("disk full")))
+    audit_module._compress_segment(broken)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["audit.log.000001", "audit.log.000002"]
+    assert list(audit_module._iter_segment_lines(broken)) == [b'{"n": 3}']
+
+
+def test_audit_show_output_matches_json_dumps(tmp_path: Path) -> None:
+    from certifai.audit import AuditRecord, _write_records, read_audit_log
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+    runner = CliRunner()
+
+    for records in ([], [AuditRecord(timestamp="t", action="enforce", data={"seq": seq, "note": "é\n"}) for seq in range(3)]):
+        _write_records(settings, records)
+        entries = read_audit_log(settings)
+        for output, indent in (("json", None), ("pretty", 2)):
+            result = runner.invoke(cli, ["audit", "show", "--log-path", str(log_path), "--output", output])
+            assert result.exit_code == 0, result.output
+            assert result.output == json.dumps(entries, indent=indent, sort_keys=output == "pretty") + "\n"
+
+
+def test_audit_batch_defers_records_to_one_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import os
+
+    from certifai.audit import audit_batch, read_audit_log, record_enforcement
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    settings = AuditSettings(enabled=True, log_path=str(log_path))
+
+    writes: list[int] = []
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: writes.append(fd) or real_write(fd, data))
+
+    with audit_batch():
+        record_enforcement(settings, "pass", ["first"])
+        with audit_batch():
+            record_enforcement(settings, "fail", ["second"])
+        assert not log_path.exists()
+
+    assert len(writes) == 1
+    assert [entry["data"]["messages"] for entry in read_audit_log(settings)] == [["first"], ["second"]]
+
+
+def test_no_audit_flag_skips_log_writes(tmp_path: Path) -> None:
+    module = tmp_path / "sample.py"
+    _write_module(
+        module,
+        """
+@certifai(ai_composed="gpt-5", human_certified="pending")
+def foo():
+    return 1
+""",
+    )
+    log_path = tmp_path / "audit.log"
+    policy_file = tmp_path / "policy.yml"
+    policy_file.write_text(f'integrations:\n  audit:\n    enabled: true\n    log_path: "{log_path}"\n', encoding="utf-8")
+
+    runner = CliRunner()
+    certify_result = runner.invoke(
+        cli,
+        ["certify", str(module), "--reviewer", "Alice", "--scrutiny", "high", "--policy", str(policy_file), "--no-audit"],
+    )
+    assert certify_result.exit_code == 0
+    assert "Alice" in module.read_text(encoding="utf-8")
+    enforce_result = runner.invoke(cli, ["enforce", "--policy", str(policy_file), "--path", str(module), "--no-audit"])
+    assert enforce_result.exit_code in {0, 1}
+
+    assert not log_path.exists() or not log_path.read_text(encoding="utf-8").strip()
+
+
+def test_blocking_issues_read_legacy_mixed_case_summary(tmp_path: Path) -> None:
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    # Summaries keep whatever casing the caller recorded them with.
+    log_path.write_text(
+        json.dumps({"timestamp": "2025-01-01T00:00:00+00:00", "action": "agent_review", "data": {"artifact": "a", "summary": {"High": 1}}})
+        + "\n",
+        encoding="utf-8",
+    )
+    audit = Audit(AuditSettings(enabled=True, log_path=str(log_path)))
+
+    assert audit.has_blocking_issues("a")
+    assert not audit.has_blocking_issues("a", min_severity="critical")
+
+
+def test_record_review_keeps_case_colliding_summary_keys(tmp_path: Path) -> None:
+    from certifai.policy import AuditSettings
+
+    log_path = tmp_path / "audit.log"
+    audit = Audit(AuditSettings(enabled=True, log_path=str(log_path)))
+    audit.record_review("agent", "a", "a.py", "issues_found", summary={"High": 2, "high": 0, "total_issues": 2})
+
+    stored = json.loads(log_path.read_text(encoding="utf-8"))
+    assert stored["data"]["summary"] == {"High": 2, "high": 0, "total_issues": 2}
+    assert audit.has_blocking_issues("a")
+
+
+def test_findings_index_rebuilds_for_replaced_log(tmp_path: Path) -> None:
+    import os
+
+    from certifai.policy import AuditSettings
+
+    def _line(action: str, data: dict) -> bytes:
+        return json.dumps({"timestamp": "2001-01-01T00:00:00+00:00", "action": action, "data": data}).encode() + b"\n"
+
+    log_path = tmp_path / "audit.log"
+    old_line = _line("agent_review", {"artifact": "o" * 200, "findings": [{"severity": "high"}]})
+    log_path.write_bytes(old_line)
+    audit = Audit(AuditSettings(enabled=True, log_path=str(log_path)))
+    assert [item["artifact"] for item in audit.get_findings(since_days=-1)] == ["o" * 200]
+
+    # Restore a different log of the same size whose line boundaries differ,
+    # so the last indexed byte is still a newline but the offsets are stale.
+    fresh = _line("agent_review", {"artifact": "fresh", "findings": [{"severity": "high"}]})
+    filler = _line("enforce", {"pad": ""})
+    filler = _line("enforce", {"pad": "x" * (len(old_line) - len(fresh) - len(filler))})
+    assert len(fresh + filler) == len(old_line)
+    replacement = tmp_path / "restored.log"
+    replacement.write_bytes(fresh + filler)
+    os.replace(replacement, log_path)
+
+    assert [item["artifact"] for item in audit.get_findings(since_days=-1)] == ["fresh"]
@@ -103,3 +103,116 @@ integrations:
     assert data["artifact"] == "foo"
     assert data["reason"] == "digest_mismatch"
     assert data["old_digest"] != data["new_digest"]
+
+
+def test_check_reuses_cached_digests_for_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    import certifai.checks as checks
+
+    from certifai.digest import compute_artifact_digest
+    from certifai.parser import parse_file
+    from certifai.registry import RegistryEntry, RegistryStore, save_registry
+
+    module = tmp_path / "cached.py"
+    module.write_text("def foo():\n    return 1\n", encoding="utf-8")
+    registry = RegistryStore()
+    registry[(str(module), "foo")] = RegistryEntry(
+        filepath=str(module),
+        qualified_name="foo",
+        digest=compute_artifact_digest(parse_file(module)[0]),
+        human_certified="peter",
+        scrutiny="high",
+        ai_composed="claude-sonnet-4",
+        finalized_at="2025-11-08T12:00:00Z",
+    )
+    save_registry(registry, tmp_path)
+    # Age the file past the racy window so its digests are cacheable.
+    os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+    assert _run_reconcile(tmp_path) == []
+    assert (tmp_path / ".certifai" / "cache" / "digest_cache.json").exists()
+    assert (tmp_path / ".certifai" / "cache" / ".gitignore").exists()
+
+    digested: list[str] = []
+    real_digests = checks._registered_digests
+    monkeypatch.setattr(checks, "_registered_digests", lambda job: digested.append(job[0]) or real_digests(job))
+
+    assert _run_reconcile(tmp_path) == []
+    assert digested == []
+
+    module.write_text(module.read_text(encoding="utf-8").replace("return 1", "return 4"), encoding="utf-8")
+    assert _run_reconcile(tmp_path) == [module]
+    assert digested == [str(module)]
+
+
+def test_check_accepts_legacy_sha256_registry_digests(tmp_path: Path) -> None:
+    from certifai.digest import DIGEST_SCHEME, compute_artifact_digest, digest_scheme
+    from certifai.parser import parse_file
+    from certifai.registry import RegistryEntry, RegistryStore, save_registry
+
+    module = tmp_path / "legacy.py"
+    module.write_text("def foo():\n    return 1\n", encoding="utf-8")
+    artifact = parse_file(module)[0]
+    legacy = compute_artifact_digest(artifact, scheme="sha256")
+    assert len(legacy) == 64 and digest_scheme(legacy) == "sha256"
+    assert compute_artifact_digest(artifact).startswith(f"{DIGEST_SCHEME}:")
+
+    registry = RegistryStore()
+    registry[(str(module), "foo")] = RegistryEntry(
+        filepath=str(module),
+        qualified_name="foo",
+        digest=legacy,
+        human_certified="peter",
+        scrutiny="high",
+        ai_composed="claude-sonnet-4",
+        finalized_at="2025-11-08T12:00:00Z",
+    )
+    save_registry(registry, tmp_path)
+
+    assert _run_reconcile(tmp_path) == []
+    module.write_text("def foo():\n    return 2\n", encoding="utf-8")
+    assert _run_reconcile(tmp_path) == [module]
+
+
+def test_batched_digests_match_single_digests_and_read_once(tmp_path: Path, monkeypatch) -> None:
+    from certifai.digest import compute_artifact_digest, compute_artifact_digests
+    from certifai.parser import parse_file
+
+    module = tmp_path / "several.py"
+    module.write_text("def one():\n    return 1\n\n\nclass Two:\n    def three(self):\n        return 3\n", encoding="utf-8")
+    artifacts = parse_file(module)
+    schemes = ["sha256", "blake2b", "sha256"]
+    expected = [
+        compute_artifact_digest(artifact, scheme=scheme) for artifact, scheme in zip(artifacts, schemes)
+    ]
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **kw: reads.append(self) or real_read_text(self, *a, **kw))
+
+    assert compute_artifact_digests(artifacts, schemes=schemes) == expected
+    assert reads == [module]
+
+
+def test_streamed_ast_digest_ignores_layout_but_not_code(tmp_path: Path) -> None:
+    from certifai.digest import DIGEST_SCHEME, compute_artifact_digest, digest_scheme
+    from certifai.parser import parse_file
+
+    module = tmp_path / "layout.py"
+    digests = []
+    for body in ("def f(x):\n    return x+1\n", "def f( x ):\n    return (x + 1)  # same\n", "def f(x):\n    return x+2\n"):
+        module.write_text(body, encoding="utf-8")
+        digests.append(compute_artifact_digest(parse_file(module)[0]))
+
+    assert digest_scheme(digests[0]) == DIGEST_SCHEME
+    assert digests[0] == digests[1]
+    assert digests[0] != digests[2]
+
+
+def test_digest_scheme_can_be_pinned_through_the_environment(monkeypatch) -> None:
+    from certifai.digest import _configured_scheme
+
+    monkeypatch.setenv("CERTIFAI_DIGEST_ALGO", "sha256")
+    assert _configured_scheme() == "sha256"
+    monkeypatch.setenv("CERTIFAI_DIGEST_ALGO", "md5")
+    assert _configured_scheme() == "blake2b"
+    monkeypatch.delenv("CERTIFAI_DIGEST_ALGO")
+    assert _configured_scheme() == "blake2b"
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import json
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -32,6 +35,19 @@ def test_report_command_outputs_json(tmp_path: Path) -> None:
     assert "total_functions" in result.output
 
 
+def test_report_json_writes_to_text_only_stdout(tmp_path: Path) -> None:
+    from certifai.cli import main
+
+    module = tmp_path / "module.py"
+    module.write_text("def foo():\n    return 42\n", encoding="utf-8")
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        assert main(["report", "--format", "json", str(module)]) == 0
+
+    assert json.loads(output.getvalue())["total_functions"] == 1
+
+
 @certifai(
     ai_composed="gpt-5",
     human_certified="PHZ",
@@ -305,3 +321,60 @@ integrations:
     assert status_result.exit_code == 0
     assert "Latest review" in status_result.output
     assert "Blocking issues (high+): yes" in status_result.output
+
+
+def test_badge_reuses_cached_report_summary(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import certifai.report as report_module
+
+    module = tmp_path / "module.py"
+    module.write_text(
+        'from certifai.decorators import certifai\n\n\n@certifai(ai_composed="gpt-5", human_certified="PHZ")\ndef foo():\n    return 42\n',
+        encoding="utf-8",
+    )
+    # Step outside the racy window so the scan is cacheable.
+    os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.chdir(tmp_path)
+
+    runner = CliRunner()
+    report_result = runner.invoke(cli, ["report", "--format", "json", str(module)])
+    assert report_result.exit_code == 0
+    assert len(list((tmp_path / ".certifai" / "cache").glob("summary-*.json"))) == 1
+    assert (tmp_path / ".certifai" / "cache" / ".gitignore").read_text(encoding="utf-8").splitlines()[-1] == "*"
+
+    def fail_parse(path):
+        raise AssertionError(f"unexpected parse of {path}")
+
+    monkeypatch.setattr(report_module, "parse_file", fail_parse)
+    badge_result = runner.invoke(cli, ["badge", str(module)])
+    assert badge_result.exit_code == 0, badge_result.output
+    assert "Human_Certified-100%25-green" in badge_result.output
+
+
+def test_compute_coverage_ratio_matches_summary(tmp_path: Path) -> None:
+    from certifai.report import build_summary, compute_coverage_ratio
+
+    module = tmp_path / "mixed.py"
+    module.write_text(
+        "from certifai.decorators import certifai\n\n\n"
+        '@certifai(ai_composed="gpt-5", human_certified="PHZ")\ndef done():\n    return 1\n\n\n'
+        '@certifai(ai_composed="gpt-5", human_certified="pending")\ndef waiting():\n    return 2\n\n\n'
+        "def plain():\n    return 3\n\n\n"
+        "class Holder:\n    pass\n",
+        encoding="utf-8",
+    )
+
+    ratio = compute_coverage_ratio([module], cache_dir=tmp_path / "cache")
+    assert ratio == build_summary([module]).coverage_ratio == 1 / 3
+
+
+def test_main_version_fast_path_matches_click(capsys) -> None:
+    from certifai.cli import main
+
+    assert main(["--version"]) == 0
+    fast = capsys.readouterr().out
+
+    result = CliRunner().invoke(cli, ["--version"], prog_name="certifai")
+    assert result.exit_code == 0
+    assert fast == result.output
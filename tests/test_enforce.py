@@ -123,3 +123,51 @@ def foo():
 
     result = enforce_ci([module], policy)
     assert result.status == "pass"
+
+
+def test_enforce_ci_scans_sources_once(tmp_path: Path, monkeypatch) -> None:
+    import certifai.enforce as enforce_module
+    import certifai.integrations.github as github_module
+
+    module = tmp_path / "pending.py"
+    _write_module(module, '@certifai(ai_composed="gpt-5", human_certified="pending")\ndef foo():\n    return 1')
+    policy = PolicyConfig(enforcement=EnforcementSettings(min_coverage=1.0), reviewers=(), integrations=IntegrationsConfig())
+
+    builds: list[object] = []
+    real_build = enforce_module.build_summary
+
+    def counting_build(paths):
+        builds.append(paths)
+        return real_build(paths)
+
+    monkeypatch.setattr(enforce_module, "build_summary", counting_build)
+    monkeypatch.setattr(github_module, "build_summary", counting_build)
+
+    result = enforce_ci([module], policy)
+    assert len(builds) == 1
+    assert result.payload["pr_status"]["summary"]["certified_total"] == 0
+    assert result.payload["summary"]["pending_review"] == 1
+
+    builds.clear()
+    enforce_ci([module, tmp_path / "removed_dir"], policy)
+    assert len(builds) == 2
+
+
+def test_enforce_ci_truncates_scanner_output(tmp_path: Path) -> None:
+    module = tmp_path / "done.py"
+    _write_module(module, '@certifai(done=True, human_certified="Reviewer")\ndef foo():\n    return 1')
+    policy = PolicyConfig(
+        enforcement=EnforcementSettings(),
+        reviewers=(),
+        integrations=IntegrationsConfig(
+            security=SecurityScannerSettings(
+                enabled=True,
+                scanners=(SecurityScannerConfig(name="noisy", command="python -c \"print('x' * 50)\""),),
+                max_output_chars=10,
+            )
+        ),
+    )
+
+    scanner = enforce_ci([module], policy).payload["security"][0]
+    assert scanner["stdout"] == "x" * 10 + "... [truncated 40 chars]"
+    assert scanner["findings"] == scanner["stdout"]
@@ -158,3 +158,42 @@ def foo():
     artifact_updated = parse_file(module)[0]
     second = compute_artifact_digest(artifact_updated)
     assert first == second
+
+
+def test_finalize_many_files_in_parallel(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from certifai.utils.parallel import MIN_PARALLEL_ITEMS
+
+    # Take the process-pool path even on single-core runners.
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    modules = [
+        _write_module(
+            source_dir / f"mod_{index}.py",
+            f'@certifai(ai_composed="gpt-5", human_certified="Reviewer")\ndef fn_{index}():\n    return {index}',
+        )
+        for index in range(MIN_PARALLEL_ITEMS + 2)
+    ]
+    _write_module(source_dir / "plain.py", "def untouched():\n    return 0")
+
+    finalized = finalize([source_dir], registry_root=tmp_path)
+
+    assert sorted(artifact.name for artifact in finalized) == sorted(f"fn_{index}" for index in range(len(modules)))
+    registry = load_registry(tmp_path)
+    for index, module in enumerate(modules):
+        assert "@certifai" not in module.read_text(encoding="utf-8")
+        assert (str(module), f"fn_{index}") in registry
+
+
+def test_finalize_counts_lines_like_the_parser(tmp_path: Path) -> None:
+    # A form feed is whitespace to Python, not a line break.
+    module = _write_module(
+        tmp_path / "paged.py",
+        'HEADER = 1\n\x0c\n\n@certifai(ai_composed="gpt-5", human_certified="Reviewer")\ndef foo():\n    return 1',
+    )
+
+    assert finalize([module], registry_root=tmp_path)
+    assert module.read_text(encoding="utf-8") == "HEADER = 1\n\x0c\n\ndef foo():\n    return 1\n"
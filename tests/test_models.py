@@ -36,3 +36,10 @@ def test_tag_metadata_reviewers_roundtrip() -> None:
     clone = metadata.clone()
     assert clone.reviewers[0].id == "Alice"
     assert not clone.is_pending_certification
+
+
+def test_scrutiny_levels_rank_by_thoroughness() -> None:
+    levels = [ScrutinyLevel.HIGH, ScrutinyLevel.AUTO, ScrutinyLevel.MEDIUM, ScrutinyLevel.LOW]
+    ranked = sorted(levels, key=lambda level: level.rank)
+    assert ranked == [ScrutinyLevel.AUTO, ScrutinyLevel.LOW, ScrutinyLevel.MEDIUM, ScrutinyLevel.HIGH]
+    assert ScrutinyLevel.HIGH.value == "high"
@@ -54,3 +54,95 @@ class Reviewed:
     assert reviewed.decorator is not None
     assert reviewed.decorator.lines[0].strip().startswith("@certifai")
     assert reviewed.indent == ""
+
+
+def test_parse_file_reuses_results_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from certifai import parser
+    from certifai.metadata import update_metadata_blocks
+
+    module = tmp_path / "cached.py"
+    module.write_text(
+        '@certifai(ai_composed="gpt-5", human_certified="pending")\ndef fn():\n    return 1\n',
+        encoding="utf-8",
+    )
+    # Age the file past the racy window so its parse is cacheable.
+    os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+
+    calls: list[Path] = []
+    real_parse = parser._parse_source
+    monkeypatch.setattr(parser, "_parse_source", lambda path: calls.append(path) or real_parse(path))
+
+    first = parse_file(module)
+    second = parse_file(module)
+    assert len(calls) == 1
+    assert [a.name for a in first] == [a.name for a in second] == ["fn"]
+    assert first is not second
+
+    metadata = first[0].tags.clone()
+    metadata.human_certified = "Alice"
+    update_metadata_blocks(module, [(first[0], metadata)])
+    assert parse_file(module)[0].tags.human_certified == "Alice"
+    assert len(calls) == 2
+
+
+def test_iter_python_files_prunes_tool_directories(tmp_path: Path) -> None:
+    from certifai.parser import iter_python_files
+
+    for relative in ("pkg/mod.py", "pkg/sub/deep.py", ".venv/lib/site.py", "pkg/__pycache__/mod.py", "build/lib/mod.py"):
+        target = tmp_path / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("", encoding="utf-8")
+    (tmp_path / "pkg" / "notes.txt").write_text("", encoding="utf-8")
+
+    found = sorted(path.relative_to(tmp_path.resolve()).as_posix() for path in iter_python_files([tmp_path]))
+    assert found == ["pkg/mod.py", "pkg/sub/deep.py"]
+
+
+def test_parse_file_finds_definitions_nested_in_statements(tmp_path: Path) -> None:
+    module = tmp_path / "nested.py"
+    module.write_text(
+        """
+import sys
+
+if sys.version_info >= (3, 10):
+    def modern():
+        return 1
+else:
+    def legacy():
+        return 0
+
+try:
+    import json
+except ImportError:
+    def fallback():
+        return None
+finally:
+    class Cleanup:
+        def run(self):
+            callback = lambda: [x for x in range(3)]
+            return callback
+
+match sys.platform:
+    case "linux":
+        async def on_linux():
+            return True
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    names = [artifact.name for artifact in parse_file(module)]
+    assert names == ["modern", "legacy", "fallback", "Cleanup", "Cleanup.run", "on_linux"]
+
+
+def test_repeated_decorators_decode_to_independent_metadata(tmp_path: Path) -> None:
+    module = tmp_path / "boilerplate.py"
+    decorator = '@certifai(ai_composed="gpt-5", human_certified="PHZ", history=["first"])\n'
+    module.write_text(f"{decorator}def one():\n    return 1\n\n\n{decorator}def two():\n    return 2\n", encoding="utf-8")
+
+    one, two = parse_file(module)
+    assert one.tags == two.tags
+    one.tags.history.append("second")
+    assert two.tags.history == ["first"]
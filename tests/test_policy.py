@@ -110,3 +110,41 @@ integrations:
     assert policy.integrations.agents.reviewers[0].id == "github/app-bot"
     assert policy.integrations.agents.reviewers[0].max_scrutiny == "medium"
     assert not policy.integrations.agents.reviewers[0].allow_finalize
+
+
+def test_load_policy_reuses_parsed_file_until_it_changes(tmp_path: Path) -> None:
+    import os
+
+    config = tmp_path / ".certifai.yml"
+    config.write_text("enforcement:\n  min_coverage: 0.5\n", encoding="utf-8")
+    # Age the file past the racy window so its parse is cacheable.
+    os.utime(config, ns=(1_000_000_000, 1_000_000_000))
+
+    first = load_policy(config)
+    assert load_policy(config) is first
+    assert first.enforcement.min_coverage == 0.5
+
+    config.write_text("enforcement:\n  min_coverage: 0.75\n", encoding="utf-8")
+    assert load_policy(config).enforcement.min_coverage == 0.75
+
+
+def test_load_policy_cache_evicts_least_recently_used(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import certifai.policy as policy_module
+
+    monkeypatch.setattr(policy_module, "_POLICY_CACHE", type(policy_module._POLICY_CACHE)())
+    monkeypatch.setattr(policy_module, "_POLICY_CACHE_SIZE", 2)
+    configs = []
+    for index in range(3):
+        config = tmp_path / f"policy_{index}.yml"
+        config.write_text(f"reviewers: [r{index}]\n", encoding="utf-8")
+        os.utime(config, ns=(1_000_000_000, 1_000_000_000))
+        configs.append(config)
+
+    first = load_policy(configs[0])
+    load_policy(configs[1])
+    assert load_policy(configs[0]) is first  # refreshes policy_0
+    load_policy(configs[2])  # evicts policy_1
+
+    assert list(policy_module._POLICY_CACHE) == [os.path.abspath(configs[0]), os.path.abspath(configs[2])]
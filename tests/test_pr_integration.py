@@ -58,3 +58,27 @@ def foo():
     assert payload["counts"]["finalized"] == 1
     assert payload["counts"]["pending_review"] == 0
     assert payload["counts"]["agent_only"] == 0
+
+
+def test_cli_pr_status_reads_paths_from_file_and_stdin(tmp_path: Path) -> None:
+    module = tmp_path / "pending.py"
+    _write_module(
+        module,
+        """
+from certifai.decorators import certifai
+
+
+@certifai(ai_composed="gpt-5", human_certified="pending")
+def foo():
+    return 1
+""",
+    )
+    listing = tmp_path / "paths.txt"
+    listing.write_text(f"\n  {module}  \r\n\n", encoding="utf-8")
+
+    runner = CliRunner()
+    from_file = runner.invoke(cli, ["pr", "status", "--paths-file", str(listing)])
+    from_stdin = runner.invoke(cli, ["pr", "status", "--paths-file", "-"], input=f"{module}\n\n")
+    for result in (from_file, from_stdin):
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["counts"]["pending_review"] == 1
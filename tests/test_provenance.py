@@ -258,3 +258,132 @@ def test_ignore_unannotated_excludes_from_coverage(tmp_path: Path) -> None:
     artifacts = parse_file(module)
     violations = enforce_policy(artifacts, policy)
     assert not violations
+
+
+def test_certify_many_files_in_parallel(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from certifai.certify import certify
+    from certifai.utils.parallel import MIN_PARALLEL_ITEMS
+
+    # Take the process-pool path even on single-core runners.
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+    modules = []
+    for index in range(MIN_PARALLEL_ITEMS + 2):
+        module = tmp_path / f"mod_{index}.py"
+        module.write_text(
+            f'@certifai(ai_composed="gpt-5", human_certified="pending")\ndef fn_{index}():\n    return {index}\n',
+            encoding="utf-8",
+        )
+        modules.append(module)
+
+    updated = certify([tmp_path], "Alice", "high")
+
+    assert sorted(artifact.name for artifact in updated) == sorted(f"fn_{index}" for index in range(len(modules)))
+    for module in modules:
+        assert parse_file(module)[0].tags.human_certified == "Alice"
+
+
+def test_certify_returns_artifacts_matching_a_fresh_parse(tmp_path: Path) -> None:
+    from certifai.certify import certify, certify_agent
+
+    module = tmp_path / "shifted.py"
+    module.write_text(
+        """
+@certifai(ai_composed="gpt-5", human_certified="pending")
+def first():
+    return 1
+
+
+def undecorated():
+    return 2
+
+
+class Holder:
+    @certifai(
+        ai_composed="gpt-5",
+        human_certified="pending",
+        notes="multi-line block",
+    )
+    def method(self):
+        return 3
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    for run in (
+        lambda: certify([module], "Alice", "high", notes="looked", include_existing=True),
+        lambda: certify_agent([module], "bot", "low", include_existing=True),
+    ):
+        updated = run()
+        fresh = {artifact.name: artifact for artifact in parse_file(module)}
+        assert [artifact.name for artifact in updated] == ["first", "undecorated", "Holder", "Holder.method"]
+        for artifact in updated:
+            assert artifact == fresh[artifact.name]
+
+
+def test_certify_skips_parsing_files_without_decorators(tmp_path: Path, monkeypatch) -> None:
+    import certifai.certify as certify_module
+
+    plain = tmp_path / "plain.py"
+    plain.write_text("def untouched():\n    return 0\n", encoding="utf-8")
+    tagged = tmp_path / "tagged.py"
+    tagged.write_text(
+        '@certifai(ai_composed="gpt-5", human_certified="pending")\ndef pending():\n    return 1\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "empty.py").write_text("", encoding="utf-8")
+
+    parsed: list[Path] = []
+
+    def tracking_parse(path: Path):
+        parsed.append(Path(path))
+        return parse_file(path)
+
+    monkeypatch.setattr(certify_module, "parse_file", tracking_parse)
+    updated = certify_module.certify([tmp_path], "Alice", "high")
+
+    assert [artifact.name for artifact in updated] == ["pending"]
+    assert parsed == [tagged]
+
+
+def test_build_history_entries_blames_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    from datetime import datetime, timezone
+
+    import certifai.history as history
+
+    module = tmp_path / "pair.py"
+    module.write_text("def one():\n    return 1\n\n\ndef two():\n    return 2\n", encoding="utf-8")
+    artifacts = parse_file(module)
+    updates = [(artifact, artifact.tags.clone()) for artifact in artifacts]
+    when = datetime(2025, 11, 8, tzinfo=timezone.utc)
+
+    blamed: list[Path] = []
+    real_blame = history.blame_commits
+    monkeypatch.setattr(history, "blame_commits", lambda path: blamed.append(path) or real_blame(path))
+
+    entries = history.build_history_entries(updates, timestamp=when, action="certified by Alice (high)")
+
+    assert blamed == [module]
+    assert entries == [
+        history.build_history_entry(artifact, metadata, timestamp=when, action="certified by Alice (high)")
+        for artifact, metadata in updates
+    ]
+
+
+def test_annotate_blames_each_file_once(tmp_path: Path, monkeypatch) -> None:
+    import certifai.history as history
+
+    module = tmp_path / "several.py"
+    module.write_text("def one():\n    return 1\n\n\ndef two():\n    return 2\n", encoding="utf-8")
+
+    blamed: list[Path] = []
+    real_blame = history.blame_commits
+    monkeypatch.setattr(history, "blame_commits", lambda path: blamed.append(path) or real_blame(path))
+
+    annotate_paths([module], ai_agent="gpt-4")
+
+    assert blamed == [module.resolve()]
+    assert [artifact.tags.ai_composed for artifact in parse_file(module)] == ["gpt-4", "gpt-4"]
@@ -4,6 +4,7 @@ import json
 import os
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from certifai.cli import cli
@@ -71,3 +72,27 @@ integrations:
     payload = json.loads(result.output)
     assert payload["status"] == "pass"
     assert payload["scanners"][0]["name"] == "demo"
+
+
+def test_run_all_scanners_keeps_configured_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    script = _create_scanner_script(
+        tmp_path,
+        """#!/usr/bin/env python3
+import json, sys, time
+time.sleep(float(sys.argv[1]))
+json.dump({"delay": sys.argv[1]}, sys.stdout)
+""",
+    )
+    settings = SecurityScannerSettings(
+        enabled=True,
+        scanners=(
+            SecurityScannerConfig(name="slow", command=f"{script} 0.3"),
+            SecurityScannerConfig(name="fast", command=f"{script} 0"),
+        ),
+    )
+
+    for cpus in (1, 4):
+        monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+        results = run_all_scanners(settings, [])
+        assert [result.name for result in results] == ["slow", "fast"]
+        assert [result.findings["delay"] for result in results] == ["0.3", "0"]